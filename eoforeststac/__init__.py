@@ -27,24 +27,42 @@ from eoforeststac import (
 )
 
 # -----------------------------------------------------------------------------
-# Writers (high-level, stable API)
+# Writers and catalog builders (high-level, stable API)
+#
+# Resolved on first access (PEP 562): writers pull in the raster/Zarr stack
+# and the catalog builders import every product config, which callers that
+# only use a provider should not pay for.
 # -----------------------------------------------------------------------------
-from eoforeststac.writers.base import BaseZarrWriter
-from eoforeststac.writers.CCI_biomass import CCIBiomassWriter
-from eoforeststac.writers.gami import GAMIWriter
-from eoforeststac.writers.saatchi_biomass import SaatchiBiomassWriter
-from eoforeststac.writers.efda import EFDAWriter
-from eoforeststac.writers.jrc_tmf import JRCTMFWriter
-from eoforeststac.writers.potapov_height import PotapovHeightWriter
+import importlib as _importlib
+
+_LAZY_ATTRS = {
+    # writers
+    "BaseZarrWriter": "eoforeststac.writers.base",
+    "CCIBiomassWriter": "eoforeststac.writers.CCI_biomass",
+    "GAMIWriter": "eoforeststac.writers.gami",
+    "SaatchiBiomassWriter": "eoforeststac.writers.saatchi_biomass",
+    "EFDAWriter": "eoforeststac.writers.efda",
+    "JRCTMFWriter": "eoforeststac.writers.jrc_tmf",
+    "PotapovHeightWriter": "eoforeststac.writers.potapov_height",
+    # catalog builders
+    "build_catalog": "eoforeststac.catalog.root",
+    "create_collection": "eoforeststac.catalog.factory",
+    "create_item": "eoforeststac.catalog.factory",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# -----------------------------------------------------------------------------
-# Catalog builders (collections + items)
-# -----------------------------------------------------------------------------
-from eoforeststac.catalog.root import build_catalog
-from eoforeststac.catalog.factory import (
-    create_collection,
-    create_item,
-)
 
 # -----------------------------------------------------------------------------
 # Configuration helpers
@@ -39,7 +39,7 @@ def create_als_products_item(version: str) -> list[pystac.Item]:
             datetime=reg["end_datetime"],
             properties=properties,
             href=item_href,
-            stac_extensions=cfg.get("stac_extensions", []),
+            stac_extensions=list(cfg.get("stac_extensions", [])),
         )
 
         all_bands = _build_raster_bands(cfg)
@@ -1,8 +1,31 @@
-from typing import List
+import datetime
+import functools
+from typing import Any, List, Mapping
 
 import pystac
 
 
+def _as_json_value(value: Any) -> Any:
+    """
+    Return a plain JSON-compatible copy of a product config value.
+
+    Product configs store read-only collections (tuples, read-only mappings);
+    pystac and STAC validation expect lists and dicts, and must never share
+    (and later mutate) the module-level config objects.
+    """
+    if isinstance(value, Mapping):
+        return {k: _as_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_as_json_value(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _isoformat(value: datetime.datetime) -> str:
+    """Return the RFC 3339 string of a config datetime."""
+    return value.isoformat()
+
+
 def _build_raster_bands(cfg: dict) -> List[dict]:
     """Build raster:bands metadata from the product config."""
     summaries = cfg.get("summaries", {})
@@ -21,7 +44,7 @@ def _build_raster_bands(cfg: dict) -> List[dict]:
         if "nodata" in overrides:
             band["nodata"] = overrides["nodata"]
         if "statistics" in overrides:
-            band["statistics"] = overrides["statistics"]
+            band["statistics"] = _as_json_value(overrides["statistics"])
         bands.append(band)
     return bands
 
@@ -31,7 +54,9 @@ def create_collection(cfg: dict) -> pystac.Collection:
 
     # Create providers
     providers = [
-        pystac.Provider(name=p["name"], roles=p.get("roles", []), url=p.get("url"))
+        pystac.Provider(
+            name=p["name"], roles=list(p.get("roles", [])), url=p.get("url")
+        )
         for p in cfg.get("providers", [])
     ]
 
@@ -43,18 +68,23 @@ def create_collection(cfg: dict) -> pystac.Collection:
         license=cfg.get("license", "CC-BY-4.0"),
         providers=providers,
         extent=pystac.Extent(
-            spatial=pystac.SpatialExtent([cfg["bbox"]]),
+            spatial=pystac.SpatialExtent([list(cfg["bbox"])]),
             temporal=pystac.TemporalExtent(
-                [[cfg["start_datetime"], cfg["end_datetime"]]]
+                [
+                    [
+                        cfg["start_datetime"],
+                        cfg["end_datetime"],
+                    ]
+                ]
             ),
         ),
-        keywords=cfg.get("keywords", []),
+        keywords=list(cfg.get("keywords", [])),
         href=cfg["collection_href"],
     )
 
     # Add STAC extensions
     if "stac_extensions" in cfg:
-        collection.stac_extensions = cfg["stac_extensions"]
+        collection.stac_extensions = list(cfg["stac_extensions"])
 
     # Add links (critical for STAC Browser experience)
     if "links" in cfg:
@@ -70,11 +100,11 @@ def create_collection(cfg: dict) -> pystac.Collection:
 
     # Add summaries (appears in STAC Browser sidebar)
     if "summaries" in cfg:
-        collection.summaries = pystac.Summaries(cfg["summaries"])
+        collection.summaries = pystac.Summaries(_as_json_value(cfg["summaries"]))
 
     # Add item_assets (defines asset structure for items)
     if "item_assets" in cfg:
-        collection.extra_fields["item_assets"] = cfg["item_assets"]
+        collection.extra_fields["item_assets"] = _as_json_value(cfg["item_assets"])
 
     # Add collection-level assets (used by STAC Browser for thumbnails/icons)
     if "assets" in cfg:
@@ -85,7 +115,7 @@ def create_collection(cfg: dict) -> pystac.Collection:
                     href=a["href"],
                     media_type=a.get("type"),
                     title=a.get("title"),
-                    roles=a.get("roles", []),
+                    roles=list(a.get("roles", [])),
                     description=a.get("description"),
                 ),
             )
@@ -102,8 +132,8 @@ def create_item(cfg: dict, version: str) -> pystac.Item:
     properties = {
         "product_name": cfg["title"],
         "version": version,
-        "start_datetime": cfg["start_datetime"].isoformat(),
-        "end_datetime": cfg["end_datetime"].isoformat(),
+        "start_datetime": _isoformat(cfg["start_datetime"]),
+        "end_datetime": _isoformat(cfg["end_datetime"]),
     }
 
     # Add extension-specific properties
@@ -119,15 +149,15 @@ def create_item(cfg: dict, version: str) -> pystac.Item:
         if "temporal_resolution" in summaries:
             properties["temporal_resolution"] = summaries["temporal_resolution"][0]
         if "variables" in summaries:
-            properties["variables"] = summaries["variables"]
+            properties["variables"] = list(summaries["variables"])
         if "units" in summaries:
-            properties["units"] = summaries["units"]
+            properties["units"] = _as_json_value(summaries["units"])
 
     # Create item
     item = pystac.Item(
         id=f"{cfg['id']}_v{version}",
-        geometry=cfg["geometry"],
-        bbox=cfg["bbox"],
+        geometry=_as_json_value(cfg["geometry"]),
+        bbox=list(cfg["bbox"]),
         datetime=cfg["end_datetime"],
         properties=properties,
         href=item_href,
@@ -135,7 +165,7 @@ def create_item(cfg: dict, version: str) -> pystac.Item:
 
     # Add STAC extensions to item
     if "stac_extensions" in cfg:
-        item.stac_extensions = cfg["stac_extensions"]
+        item.stac_extensions = list(cfg["stac_extensions"])
 
     # Add main Zarr asset with rich metadata
     if "asset_template" in cfg:
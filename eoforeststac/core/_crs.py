@@ -0,0 +1,18 @@
+"""Per-object memoization of CRS strings for xarray objects."""
+
+import weakref
+
+# id(obj) -> (weakref to obj, rio CRS object, CRS string)
+_CRS_CACHE: dict[int, tuple[weakref.ref, object, str]] = {}
+
+
+def crs_to_string(obj, crs) -> str:
+    """``crs.to_string()`` (a PROJ call) memoized per object and CRS object."""
+    key = id(obj)
+    hit = _CRS_CACHE.get(key)
+    if hit is not None and hit[0]() is obj and hit[1] is crs:
+        return hit[2]
+    crs_str = crs.to_string()
+    ref = weakref.ref(obj, lambda _, key=key: _CRS_CACHE.pop(key, None))
+    _CRS_CACHE[key] = (ref, crs, crs_str)
+    return crs_str
@@ -0,0 +1,12 @@
+"""Shared, cached UTC datetimes for product configs."""
+
+import datetime
+import functools
+
+UTC = datetime.timezone.utc
+
+
+@functools.lru_cache(maxsize=None)
+def utc_date(year: int, month: int = 1, day: int = 1) -> datetime.datetime:
+    """Midnight UTC on the given day; one shared (immutable) object per date."""
+    return datetime.datetime(year, month, day, tzinfo=UTC)
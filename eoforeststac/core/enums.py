@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class Role(str, Enum):
+    """STAC provider roles (plus 'funding', used for project funders)."""
+
+    LICENSOR = "licensor"
+    PRODUCER = "producer"
+    PROCESSOR = "processor"
+    HOST = "host"
+    FUNDING = "funding"
+
+
+class License(str, Enum):
+    """License tokens used by the product configs."""
+
+    CC_BY_4_0 = "CC-BY-4.0"
+    EUPL_1_2 = "EUPL-1.2"
+    OPEN_ACCESS = "Open-access"
+    PROPRIETARY = "proprietary"
+    VARIOUS = "various"
@@ -0,0 +1,24 @@
+import functools
+from typing import Any, Dict, Sequence, Tuple
+
+
+@functools.lru_cache(maxsize=64)
+def _bbox_ring(
+    bbox: Tuple[float, float, float, float],
+) -> Tuple[Tuple[float, float], ...]:
+    west, south, east, north = bbox
+    return (
+        (west, south),
+        (west, north),
+        (east, north),
+        (east, south),
+        (west, south),
+    )
+
+
+def bbox_to_polygon(bbox: Sequence[float]) -> Dict[str, Any]:
+    """GeoJSON Polygon (closed ring) covering a [west, south, east, north] bbox.
+
+    Coordinates are shared immutable tuples, cached per bbox.
+    """
+    return {"type": "Polygon", "coordinates": (_bbox_ring(tuple(bbox)),)}
@@ -2,7 +2,8 @@
 
 import boto3
 import fsspec
-import json
+import orjson
+from collections.abc import Mapping
 from botocore.config import Config
 from eoforeststac.core.config import S3_ENDPOINT_URL, S3_PROFILE
 
@@ -61,6 +62,11 @@ def get_fs(url: str):
 # -------------------------------------------------------------------
 def write_text(url: str, text: str):
     """Write text to S3 or local filesystem."""
+    write_bytes(url, text.encode("utf-8"))
+
+
+def write_bytes(url: str, data: bytes):
+    """Write already-encoded (UTF-8) JSON bytes to S3 or local filesystem."""
     if url.startswith("s3://"):
         parts = url.replace("s3://", "").split("/", 1)
         if len(parts) != 2:
@@ -71,14 +77,14 @@ def write_text(url: str, text: str):
         client.put_object(
             Bucket=bucket,
             Key=key,
-            Body=text.encode("utf-8"),
+            Body=data,
             ContentType="application/json",
         )
         return
 
     # Local
-    with open(url, "w") as f:
-        f.write(text)
+    with open(url, "wb") as f:
+        f.write(data)
 
 
 def read_text(url: str) -> str:
@@ -88,8 +94,27 @@ def read_text(url: str) -> str:
         return f.read()
 
 
+def _orjson_default(obj):
+    # Frozen product configs hold read-only mappings (MappingProxyType)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: dict) -> bytes:
+    """
+    Serialize a STAC dict to UTF-8 JSON bytes: 2-space indent, non-ASCII
+    characters written as-is, UTC datetimes with a "Z" suffix.
+    """
+    return orjson.dumps(
+        obj,
+        default=_orjson_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z,
+    )
+
+
 def write_json(url: str, obj: dict):
-    write_text(url, json.dumps(obj, indent=2))
+    write_bytes(url, dumps_json(obj))
 
 
 def exists(url: str) -> bool:
@@ -0,0 +1,90 @@
+"""Immutable product configuration container.
+
+Product configs are static metadata read many times while building the
+catalog. ``freeze`` turns a plain config dict into nested read-only views
+(mappings become ``MappingProxyType``, lists become tuples).
+``ProductCfg`` stores the core fields in slots (attribute access, no
+per-instance ``__dict__``) and still behaves as a read-only mapping, so
+``cfg["base_path"]``, ``cfg.get(...)``, ``{**cfg}`` and schema validation
+keep working for code written against the plain-dict configs.
+
+Products that memoize their asset template (e.g. ``products/radd_europe.py``)
+use a top-level ``_make_<product>_asset`` factory instead of a lambda, so the
+factory can be pickled and sent to worker processes. The factory returns a
+``clone()`` of the cached template because ``Item.add_asset`` mutates the
+asset it is given.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class ProductCfg(Mapping[str, Any]):
+    """
+    Frozen product configuration.
+
+    Keys that are not core fields (``themes``, ``license_notes``,
+    ``version_notes``, ...) go in ``extra`` and are exposed through the
+    mapping interface like any other key.
+    """
+
+    id: str
+    title: str
+    description: str
+    bbox: Sequence[float]
+    geometry: Mapping[str, Any]
+    start_datetime: datetime.datetime
+    end_datetime: datetime.datetime
+    collection_href: str
+    base_path: str
+    license: str
+    providers: Sequence[Mapping[str, Any]]
+    keywords: Sequence[str]
+    links: Sequence[Mapping[str, Any]]
+    stac_extensions: Sequence[str]
+    summaries: Mapping[str, Any]
+    raster_bands: Mapping[str, Any]
+    item_assets: Mapping[str, Any]
+    asset_template: Mapping[str, Any]
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, cfg: Mapping[str, Any]) -> "ProductCfg":
+        """Build from a config mapping; non-core keys are moved to ``extra``."""
+        core = {k: cfg[k] for k in _CORE_FIELDS}
+        extra = {k: v for k, v in cfg.items() if k not in _CORE_FIELD_SET}
+        return cls(**core, extra=extra)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _CORE_FIELD_SET:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _CORE_FIELDS
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(_CORE_FIELDS) + len(self.extra)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a shallow plain-dict copy (core fields + extras)."""
+        return dict(self)
+
+
+_CORE_FIELDS = tuple(f.name for f in fields(ProductCfg) if f.name != "extra")
+_CORE_FIELD_SET = frozenset(_CORE_FIELDS)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
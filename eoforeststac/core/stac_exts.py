@@ -0,0 +1,13 @@
+# Shared STAC extension schema URLs used by the product configs
+EO_EXT = "https://stac-extensions.github.io/eo/v1.1.0/schema.json"
+PROJ_EXT = "https://stac-extensions.github.io/proj/v1.1.0/schema.json"
+FILE_EXT = "https://stac-extensions.github.io/file/v2.1.0/schema.json"
+RASTER_EXT = "https://stac-extensions.github.io/raster/v1.1.0/schema.json"
+ITEM_ASSETS_EXT = "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json"
+SCIENTIFIC_EXT = "https://stac-extensions.github.io/scientific/v1.0.0/schema.json"
+
+# Extensions signalled by every gridded product (bands, nodata, item_assets, ...)
+COMMON_EXT = (EO_EXT, PROJ_EXT, FILE_EXT, RASTER_EXT, ITEM_ASSETS_EXT)
+
+# Common extensions plus the scientific extension (DOI / citation fields)
+COMMON_SCI_EXT = COMMON_EXT + (SCIENTIFIC_EXT,)
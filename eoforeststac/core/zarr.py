@@ -6,3 +6,21 @@ DEFAULT_COMPRESSOR = Blosc(
     shuffle=Blosc.BITSHUFFLE,
     blocksize=0,
 )
+
+# Low-cardinality class/flag rasters (disturbance occurrence, agent, ...):
+# long runs compress further at a higher zstd level, for a modest encode cost
+CATEGORICAL_COMPRESSOR = Blosc(
+    cname="zstd",
+    clevel=5,
+    shuffle=Blosc.BITSHUFFLE,
+    blocksize=0,
+)
+
+# Small monotonic coordinate arrays (e.g. encoded time): paired with a Delta
+# filter the steps are near-constant and compress to a few bytes
+COORDINATE_COMPRESSOR = Blosc(
+    cname="zstd",
+    clevel=9,
+    shuffle=Blosc.SHUFFLE,
+    blocksize=0,
+)
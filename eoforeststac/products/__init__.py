@@ -0,0 +1,44 @@
+"""
+Product configurations (one module per product).
+
+Configs are importable from here, e.g. ``from eoforeststac.products import
+EFDA_CFG``; each product module is imported on first access (PEP 562) so
+unused products cost nothing at import time.
+"""
+
+import importlib
+
+_CFG_MODULES = {
+    "ALS_PRODUCTS_CFG": "als_products",
+    "CCI_BIOMASS_CFG": "cci_biomass",
+    "EFDA_CFG": "efda",
+    "FORESTPATHS_GENUS_CFG": "forestpaths_genus",
+    "GAMI_CFG": "gami",
+    "GAMI_AGECLASS_CFG": "gami_ageclass",
+    "GEDI_L4D_CFG": "gedi_l4d",
+    "HANSEN_GFC_CFG": "hansen_gfc",
+    "JRC_GFC_CFG": "jrc_gfc",
+    "JRC_TMF_CFG": "jrc_tmf",
+    "LIU_BIOMASS_CFG": "liu_biomass",
+    "POTAPOV_HEIGHT_CFG": "potapov_height",
+    "POTAPOV_LCLUC_CFG": "potapov_lcluc",
+    "RADD_EUROPE_CFG": "radd_europe",
+    "RESTOR_LANDUSE_CFG": "restor_landuse",
+    "ROBINSON_CR_CFG": "robinson_cr",
+    "SAATCHI_BIOMASS_CFG": "saatchi_biomass",
+    "ULS_PRODUCTS_CFG": "uls_products",
+    "WANG_FORESTAGE_CFG": "wang_forestage",
+}
+
+
+def __getattr__(name: str):
+    module = _CFG_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CFG_MODULES))
@@ -1,5 +1,6 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
+from eoforeststac.core.stac_exts import COMMON_EXT
 
 ALS_RESOLUTIONS = {
     "1m": {"gsd": 1.0, "variables": ["chm", "dtm", "dsm"]},
@@ -79,8 +80,8 @@ REGIONS = {
             ],
         },
         "proj_epsg": 25830,
-        "start_datetime": datetime.datetime(2015, 1, 1, tzinfo=datetime.timezone.utc),
-        "end_datetime": datetime.datetime(2023, 12, 31, tzinfo=datetime.timezone.utc),
+        "start_datetime": utc_date(2015, 1, 1),
+        "end_datetime": utc_date(2023, 12, 31),
         "zarr_name": "ALS_SPAIN_PNOA",
     },
     "brazil_eba": {
@@ -104,8 +105,8 @@ REGIONS = {
             ],
         },
         "proj_epsg": 31983,
-        "start_datetime": datetime.datetime(2016, 1, 1, tzinfo=datetime.timezone.utc),
-        "end_datetime": datetime.datetime(2018, 12, 31, tzinfo=datetime.timezone.utc),
+        "start_datetime": utc_date(2016, 1, 1),
+        "end_datetime": utc_date(2018, 12, 31),
         "zarr_name": "ALS_BRAZIL_EBA",
     },
 }
@@ -140,8 +141,8 @@ ALS_PRODUCTS_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(2015, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2023, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2015, 1, 1),
+    "end_datetime": utc_date(2023, 12, 31),
     "collection_href": f"{S3_HTTP_BASE}/ALS_PRODUCTS/collection.json",
     "base_path": f"{S3_HTTP_BASE}/ALS_PRODUCTS",
     "license": "EUPL-1.2",
@@ -184,13 +185,7 @@ ALS_PRODUCTS_CFG = {
             "title": "alsdb – ALS gridded products pipeline (cite repository until DOI is available)",
         },
     ],
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_EXT,
     "summaries": {
         "temporal_resolution": ["multi-year"],
         "variables": [
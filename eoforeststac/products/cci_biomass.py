@@ -1,6 +1,7 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
 from eoforeststac.core.assets import create_zarr_asset
+from eoforeststac.core.stac_exts import COMMON_EXT
 
 # ----------------------------------------------------------------------
 # Per-version temporal coverage (years actually published on CEDA for
@@ -13,12 +14,12 @@ from eoforeststac.core.assets import create_zarr_asset
 # ----------------------------------------------------------------------
 CCI_BIOMASS_VERSION_EXTENT = {
     "6.0": (
-        datetime.datetime(2007, 1, 1, tzinfo=datetime.timezone.utc),
-        datetime.datetime(2022, 12, 31, tzinfo=datetime.timezone.utc),
+        utc_date(2007, 1, 1),
+        utc_date(2022, 12, 31),
     ),
     "7.0": (
-        datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc),
-        datetime.datetime(2024, 12, 31, tzinfo=datetime.timezone.utc),
+        utc_date(2005, 1, 1),
+        utc_date(2024, 12, 31),
     ),
 }
 
@@ -34,7 +35,9 @@ CCI_BIOMASS_CFG = {
         "v7.0 provides 2005-2012 and 2015-2024 (see item `start_datetime`/`end_datetime` for the exact "
         "span of each version). The product supports carbon-cycle analysis, model evaluation, and "
         "large-scale assessments of biomass distribution and change.\n\n"
-        "This collection provides an analysis-ready Zarr packaging for cloud-native access."
+        "This collection provides an analysis-ready Zarr packaging for cloud-native access. "
+        "`aboveground_biomass_std` is stored as int16 in whole Mg ha-1, as in the source; "
+        "values beyond ±32767 Mg ha-1 are clipped to that limit (-32768 is nodata)."
     ),
     # ------------------------------------------------------------------
     # Spatial / temporal extent
@@ -52,8 +55,8 @@ CCI_BIOMASS_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2024, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2005, 1, 1),
+    "end_datetime": utc_date(2024, 12, 31),
     # ------------------------------------------------------------------
     # HREF layout
     # ------------------------------------------------------------------
@@ -63,22 +66,22 @@ CCI_BIOMASS_CFG = {
     # Governance
     # ------------------------------------------------------------------
     "license": "Open-access",
-    "providers": [
+    "providers": (
         {
             "name": "ESA Climate Change Initiative (CCI)",
-            "roles": ["producer"],
+            "roles": ("producer",),
             "url": "https://climate.esa.int",
         },
         {
             "name": "GFZ Helmholtz Centre Potsdam",
-            "roles": ["processor", "host"],
+            "roles": ("processor", "host"),
             "url": "https://www.gfz.de",
         },
-    ],
+    ),
     # ------------------------------------------------------------------
     # Discovery helpers
     # ------------------------------------------------------------------
-    "keywords": [
+    "keywords": (
         "aboveground biomass",
         "biomass",
         "carbon",
@@ -89,13 +92,13 @@ CCI_BIOMASS_CFG = {
         "remote sensing",
         "zarr",
         "stac",
-    ],
+    ),
     # Optional but often useful for “atlas” grouping (your own convention)
-    "themes": ["carbon", "biomass", "forest structure"],
+    "themes": ("carbon", "biomass", "forest structure"),
     # ------------------------------------------------------------------
     # Links (what makes STAC Browser feel curated)
     # ------------------------------------------------------------------
-    "links": [
+    "links": (
         # Official documentation
         {
             "rel": "about",
@@ -116,35 +119,29 @@ CCI_BIOMASS_CFG = {
             "type": "text/html",
             "title": "Dataset DOI (v7.0)",
         },
-    ],
+    ),
     # ------------------------------------------------------------------
     # Extensions (signal what fields might exist in items/assets)
     # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",  # bands, nodata, etc.
-    ],
+    "stac_extensions": COMMON_EXT,
     # ------------------------------------------------------------------
     # Summaries (client-friendly structured metadata)
     # ------------------------------------------------------------------
     "summaries": {
-        "temporal_resolution": ["annual"],
-        "variables": ["aboveground_biomass", "aboveground_biomass_std"],
+        "temporal_resolution": ("annual",),
+        "variables": ("aboveground_biomass", "aboveground_biomass_std"),
         "units_by_variable": {
             "aboveground_biomass": "Mg ha-1",
             "aboveground_biomass_std": "Mg ha-1",
         },
-        "eo:gsd": [100.0],
-        "proj:epsg": [4326],
-        "product_family": ["ESA CCI Biomass"],
-        "data_format": ["zarr"],
+        "eo:gsd": (100.0,),
+        "proj:epsg": (4326,),
+        "product_family": ("ESA CCI Biomass",),
+        "data_format": ("zarr",),
     },
     "raster_bands": {
         "aboveground_biomass": {"data_type": "int32", "nodata": -9999},
-        "aboveground_biomass_std": {"data_type": "int32", "nodata": -9999},
+        "aboveground_biomass_std": {"data_type": "int16", "nodata": -32768},
     },
     "item_assets": {
         "zarr": {
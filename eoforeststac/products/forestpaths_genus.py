@@ -1,6 +1,7 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
 from eoforeststac.core.assets import create_zarr_asset
+from eoforeststac.core.stac_exts import COMMON_SCI_EXT
 
 FORESTPATHS_GENUS_CFG = {
     # ------------------------------------------------------------------
@@ -31,8 +32,8 @@ FORESTPATHS_GENUS_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2020, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2020, 1, 1),
+    "end_datetime": utc_date(2020, 12, 31),
     # ------------------------------------------------------------------
     # HREF layout
     # ------------------------------------------------------------------
@@ -104,14 +105,7 @@ FORESTPATHS_GENUS_CFG = {
     # ------------------------------------------------------------------
     # Extensions (signal what fields might exist in items/assets)
     # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-        "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_SCI_EXT,
     # ------------------------------------------------------------------
     # Summaries (client-friendly structured metadata)
     # ------------------------------------------------------------------
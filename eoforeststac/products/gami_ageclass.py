@@ -1,5 +1,6 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
+from eoforeststac.core.stac_exts import COMMON_SCI_EXT
 
 # Mapping: resolution label -> (GSD in metres at equator, input dir suffix)
 GAMI_AGECLASS_RESOLUTIONS = {
@@ -43,8 +44,8 @@ GAMI_AGECLASS_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(2010, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2020, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2010, 1, 1),
+    "end_datetime": utc_date(2020, 12, 31),
     # ------------------------------------------------------------------
     # HREF layout
     # ------------------------------------------------------------------
@@ -100,14 +101,7 @@ GAMI_AGECLASS_CFG = {
     # ------------------------------------------------------------------
     # Extensions
     # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-        "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_SCI_EXT,
     # ------------------------------------------------------------------
     # Summaries (collection-level; items carry resolution-specific values)
     # ------------------------------------------------------------------
@@ -1,6 +1,7 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
 from eoforeststac.core.assets import create_zarr_asset
+from eoforeststac.core.stac_exts import COMMON_SCI_EXT
 
 GEDI_L4D_CFG = {
     # ------------------------------------------------------------------
@@ -33,8 +34,8 @@ GEDI_L4D_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(2019, 4, 18, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2023, 3, 16, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2019, 4, 18),
+    "end_datetime": utc_date(2023, 3, 16),
     # ------------------------------------------------------------------
     # HREF layout
     # ------------------------------------------------------------------
@@ -94,14 +95,7 @@ GEDI_L4D_CFG = {
     # ------------------------------------------------------------------
     # Extensions
     # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-        "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_SCI_EXT,
     # ------------------------------------------------------------------
     # Summaries
     # ------------------------------------------------------------------
@@ -1,6 +1,7 @@
-import datetime
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
 from eoforeststac.core.assets import create_zarr_asset
+from eoforeststac.core.stac_exts import COMMON_SCI_EXT
 
 JRC_TMF_CFG = {
     # ------------------------------------------------------------------
@@ -32,8 +33,8 @@ JRC_TMF_CFG = {
             ]
         ],
     },
-    "start_datetime": datetime.datetime(1990, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2024, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(1990, 1, 1),
+    "end_datetime": utc_date(2024, 12, 31),
     # ------------------------------------------------------------------
     # HREF layout
     # ------------------------------------------------------------------
@@ -118,14 +119,7 @@ JRC_TMF_CFG = {
     # ------------------------------------------------------------------
     # Extensions (signal what fields might exist in items/assets)
     # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-        "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_SCI_EXT,
     # ------------------------------------------------------------------
     # Summaries (client-friendly structured metadata)
     # ------------------------------------------------------------------
@@ -1,161 +1,169 @@
-import datetime
+import functools
+
+import pystac
+
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
 from eoforeststac.core.assets import create_zarr_asset
+from eoforeststac.core.geom import bbox_to_polygon
+from eoforeststac.core.product import ProductCfg, freeze
+from eoforeststac.core.stac_exts import COMMON_SCI_EXT
 
-SAATCHI_BIOMASS_CFG = {
-    # ------------------------------------------------------------------
-    # Identity / narrative (atlas-friendly)
-    # ------------------------------------------------------------------
-    "id": "SAATCHI_BIOMASS",
-    "title": "Saatchi & Yu - 2020 Global aboveground biomass (100 m)",
-    "description": (
-        "Global live woody vegetation / aboveground biomass mapping product at 100 m spatial resolution, "
-        "distributed as a global aboveground biomass mosaic for reference year 2020. "
-        "This STAC collection packages the Zenodo deliverable 'Mapping Global Live Woody Vegetation "
-        "Biomass at Optimum Spatial Resolutions' and associated supplementary documentation.\n\n"
-        "This collection provides an analysis-ready Zarr packaging for cloud-native access."
-    ),
-    # ------------------------------------------------------------------
-    # Spatial / temporal extent
-    # ------------------------------------------------------------------
-    "bbox": [-180.0, -90.0, 180.0, 90.0],
-    "geometry": {
-        "type": "Polygon",
-        "coordinates": [
-            [
-                [-180.0, -90.0],
-                [-180.0, 90.0],
-                [180.0, 90.0],
-                [180.0, -90.0],
-                [-180.0, -90.0],
-            ]
-        ],
-    },
-    "start_datetime": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(2020, 12, 31, tzinfo=datetime.timezone.utc),
-    # ------------------------------------------------------------------
-    # HREF layout
-    # ------------------------------------------------------------------
-    "collection_href": f"{S3_HTTP_BASE}/SAATCHI_BIOMASS/collection.json",
-    "base_path": f"{S3_HTTP_BASE}/SAATCHI_BIOMASS",
-    # ------------------------------------------------------------------
-    # Governance
-    # ------------------------------------------------------------------
-    "license": "CC-BY-4.0",
-    "providers": [
-        {
-            "name": "Jet Propulsion Laboratory (Caltech) – Saatchi et al.",
-            "roles": ["producer"],
-            "url": "https://www.jpl.nasa.gov/",
-        },
-        {
-            "name": "Zenodo",
-            "roles": ["host"],
-            "url": "https://zenodo.org/records/15858551",
-        },
-        {
-            "name": "GFZ Helmholtz Centre Potsdam",
-            "roles": ["processor", "host"],
-            "url": "https://www.gfz.de",
-        },
-    ],
-    # ------------------------------------------------------------------
-    # Discovery helpers
-    # ------------------------------------------------------------------
-    "keywords": [
-        "aboveground biomass",
-        "AGB",
-        "live woody biomass",
-        "carbon density",
-        "forest biomass",
-        "global",
-        "100 m",
-        "remote sensing",
-        "zarr",
-        "stac",
-    ],
-    "themes": ["biomass", "carbon", "forest structure"],
-    # ------------------------------------------------------------------
-    # Links (curated STAC Browser experience)
-    # ------------------------------------------------------------------
-    "links": [
-        # Canonical links
-        {
-            "rel": "about",
-            "href": "https://zenodo.org/records/15858551",
-            "type": "text/html",
-            "title": "Zenodo landing page (files, description, license)",
-        },
-        {
-            "rel": "cite-as",
-            "href": "https://doi.org/10.5281/zenodo.15858551",
-            "type": "text/html",
-            "title": "Dataset DOI (Zenodo): Mapping Global Live Woody Vegetation Biomass at Optimum Spatial Resolutions",
-        },
+_SAATCHI_BBOX = [-180.0, -90.0, 180.0, 90.0]
+_SAATCHI_HREF_FMT = "{base_path}/SAATCHI_BIOMASS_v{v}.zarr"
+_SAATCHI_TITLE_FMT = "Saatchi & Yu global AGB 100 m (2020) v{v} (Zarr)"
+_SAATCHI_ASSET_DESC = (
+    "Cloud-optimized Zarr store packaging of the global aboveground biomass mosaic for reference year 2020, "
+    "originally distributed as a Cloud-Optimized GeoTIFF on Zenodo (10.5281/zenodo.15858551)."
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _saatchi_zarr_asset(base_path: str, v: str) -> pystac.Asset:
+    return create_zarr_asset(
+        href=_SAATCHI_HREF_FMT.format(base_path=base_path, v=v),
+        title=_SAATCHI_TITLE_FMT.format(v=v),
+        roles=["data"],
+        description=_SAATCHI_ASSET_DESC,
+    )
+
+
+def _make_saatchi_asset(cfg, v: str) -> pystac.Asset:
+    return _saatchi_zarr_asset(cfg["base_path"], v).clone()
+
+
+SAATCHI_BIOMASS_CFG = ProductCfg.from_mapping(
+    freeze(
         {
-            "rel": "related",
-            "href": "https://doi.org/10.5281/zenodo.7583611",
-            "type": "text/html",
-            "title": "Related work (compiled article / deliverable link)",
-        },
-    ],
-    # ------------------------------------------------------------------
-    # Extensions (signal what fields might exist in items/assets)
-    # ------------------------------------------------------------------
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-        "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
-    ],
-    # ------------------------------------------------------------------
-    # Summaries (client-friendly structured metadata)
-    # ------------------------------------------------------------------
-    "summaries": {
-        "temporal_resolution": ["static"],
-        "reference_year": [2020],
-        "variables": ["aboveground_biomass"],
-        "units_by_variable": {"aboveground_biomass": "Mg ha-1"},
-        "eo:gsd": [100.0],
-        "proj:epsg": [4326],
-        "product_family": ["Saatchi & Yu global AGB"],
-        "data_format": ["zarr"],
-    },
-    "raster_bands": {
-        "aboveground_biomass": {"data_type": "int32", "nodata": -9999},
-    },
-    # ------------------------------------------------------------------
-    # Item assets template (for Item Assets extension)
-    # ------------------------------------------------------------------
-    "item_assets": {
-        "zarr": {
-            "title": "Zarr dataset",
-            "description": "Cloud-optimized Zarr store of the Saatchi & Yu global aboveground biomass mosaic (2020).",
-            "roles": ["data"],
-            "type": "application/vnd.zarr",
-        }
-    },
-    # ------------------------------------------------------------------
-    # Asset template (roles + description)
-    # ------------------------------------------------------------------
-    "asset_template": {
-        "key": "zarr",
-        "factory": lambda cfg, v: create_zarr_asset(
-            href=f"{cfg['base_path']}/SAATCHI_BIOMASS_v{v}.zarr",
-            title=f"Saatchi & Yu global AGB 100 m (2020) v{v} (Zarr)",
-            roles=["data"],
-            description=(
-                "Cloud-optimized Zarr store packaging of the global aboveground biomass mosaic for reference year 2020, "
-                "originally distributed as a Cloud-Optimized GeoTIFF on Zenodo (10.5281/zenodo.15858551)."
+            # ------------------------------------------------------------------
+            # Identity / narrative (atlas-friendly)
+            # ------------------------------------------------------------------
+            "id": "SAATCHI_BIOMASS",
+            "title": "Saatchi & Yu - 2020 Global aboveground biomass (100 m)",
+            "description": (
+                "Global live woody vegetation / aboveground biomass mapping product at 100 m spatial resolution, "
+                "distributed as a global aboveground biomass mosaic for reference year 2020. "
+                "This STAC collection packages the Zenodo deliverable 'Mapping Global Live Woody Vegetation "
+                "Biomass at Optimum Spatial Resolutions' and associated supplementary documentation.\n\n"
+                "This collection provides an analysis-ready Zarr packaging for cloud-native access."
             ),
-        ),
-    },
-    # ------------------------------------------------------------------
-    # Version notes
-    # ------------------------------------------------------------------
-    "version_notes": {
-        "2.0": "Zenodo record published as Version v2 (Oct 7, 2025).",
-    },
-}
+            # ------------------------------------------------------------------
+            # Spatial / temporal extent
+            # ------------------------------------------------------------------
+            "bbox": _SAATCHI_BBOX,
+            "geometry": bbox_to_polygon(_SAATCHI_BBOX),
+            "start_datetime": utc_date(2020, 1, 1),
+            "end_datetime": utc_date(2020, 12, 31),
+            # ------------------------------------------------------------------
+            # HREF layout
+            # ------------------------------------------------------------------
+            "collection_href": f"{S3_HTTP_BASE}/SAATCHI_BIOMASS/collection.json",
+            "base_path": f"{S3_HTTP_BASE}/SAATCHI_BIOMASS",
+            # ------------------------------------------------------------------
+            # Governance
+            # ------------------------------------------------------------------
+            "license": "CC-BY-4.0",
+            "providers": [
+                {
+                    "name": "Jet Propulsion Laboratory (Caltech) – Saatchi et al.",
+                    "roles": ["producer"],
+                    "url": "https://www.jpl.nasa.gov/",
+                },
+                {
+                    "name": "Zenodo",
+                    "roles": ["host"],
+                    "url": "https://zenodo.org/records/15858551",
+                },
+                {
+                    "name": "GFZ Helmholtz Centre Potsdam",
+                    "roles": ["processor", "host"],
+                    "url": "https://www.gfz.de",
+                },
+            ],
+            # ------------------------------------------------------------------
+            # Discovery helpers
+            # ------------------------------------------------------------------
+            "keywords": [
+                "aboveground biomass",
+                "AGB",
+                "live woody biomass",
+                "carbon density",
+                "forest biomass",
+                "global",
+                "100 m",
+                "remote sensing",
+                "zarr",
+                "stac",
+            ],
+            "themes": ["biomass", "carbon", "forest structure"],
+            # ------------------------------------------------------------------
+            # Links (curated STAC Browser experience)
+            # ------------------------------------------------------------------
+            "links": [
+                # Canonical links
+                {
+                    "rel": "about",
+                    "href": "https://zenodo.org/records/15858551",
+                    "type": "text/html",
+                    "title": "Zenodo landing page (files, description, license)",
+                },
+                {
+                    "rel": "cite-as",
+                    "href": "https://doi.org/10.5281/zenodo.15858551",
+                    "type": "text/html",
+                    "title": "Dataset DOI (Zenodo): Mapping Global Live Woody Vegetation Biomass at Optimum Spatial Resolutions",
+                },
+                {
+                    "rel": "related",
+                    "href": "https://doi.org/10.5281/zenodo.7583611",
+                    "type": "text/html",
+                    "title": "Related work (compiled article / deliverable link)",
+                },
+            ],
+            # ------------------------------------------------------------------
+            # Extensions (signal what fields might exist in items/assets)
+            # ------------------------------------------------------------------
+            "stac_extensions": COMMON_SCI_EXT,
+            # ------------------------------------------------------------------
+            # Summaries (client-friendly structured metadata)
+            # ------------------------------------------------------------------
+            "summaries": {
+                "temporal_resolution": ["static"],
+                "reference_year": [2020],
+                "variables": ["aboveground_biomass"],
+                "units_by_variable": {"aboveground_biomass": "Mg ha-1"},
+                "eo:gsd": [100.0],
+                "proj:epsg": [4326],
+                "product_family": ["Saatchi & Yu global AGB"],
+                "data_format": ["zarr"],
+            },
+            "raster_bands": {
+                "aboveground_biomass": {"data_type": "int32", "nodata": -9999},
+            },
+            # ------------------------------------------------------------------
+            # Item assets template (for Item Assets extension)
+            # ------------------------------------------------------------------
+            "item_assets": {
+                "zarr": {
+                    "title": "Zarr dataset",
+                    "description": "Cloud-optimized Zarr store of the Saatchi & Yu global aboveground biomass mosaic (2020).",
+                    "roles": ["data"],
+                    "type": "application/vnd.zarr",
+                }
+            },
+            # ------------------------------------------------------------------
+            # Asset template (roles + description)
+            # ------------------------------------------------------------------
+            "asset_template": {
+                "key": "zarr",
+                "factory": _make_saatchi_asset,
+            },
+            # ------------------------------------------------------------------
+            # Version notes
+            # ------------------------------------------------------------------
+            "version_notes": {
+                "2.0": "Zenodo record published as Version v2 (Oct 7, 2025).",
+            },
+        }
+    )
+)
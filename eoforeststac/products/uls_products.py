@@ -1,6 +1,6 @@
-import datetime
-
+from eoforeststac.core._dates import utc_date
 from eoforeststac.core.config import S3_HTTP_BASE
+from eoforeststac.core.stac_exts import COMMON_EXT
 from eoforeststac.products.als_products import ALS_RESOLUTIONS
 
 ULS_RESOLUTIONS = {
@@ -127,8 +127,8 @@ REGIONS = {
             ],
         },
         "proj_epsg": 32632,
-        "start_datetime": datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
-        "end_datetime": datetime.datetime(2022, 12, 31, tzinfo=datetime.timezone.utc),
+        "start_datetime": utc_date(2022, 1, 1),
+        "end_datetime": utc_date(2022, 12, 31),
         "zarr_name": "ULS_HAINICH",
     },
     "test_region": {
@@ -152,8 +152,8 @@ REGIONS = {
             ],
         },
         "proj_epsg": 32632,
-        "start_datetime": datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
-        "end_datetime": datetime.datetime(2022, 12, 31, tzinfo=datetime.timezone.utc),
+        "start_datetime": utc_date(2022, 1, 1),
+        "end_datetime": utc_date(2022, 12, 31),
         "zarr_name": "ULS_TEST_REGION",
     },
 }
@@ -179,8 +179,8 @@ ULS_PRODUCTS_CFG = {
             [[-10.0, 35.0], [-10.0, 70.0], [32.0, 70.0], [32.0, 35.0], [-10.0, 35.0]]
         ],
     },
-    "start_datetime": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
-    "end_datetime": datetime.datetime(9999, 12, 31, tzinfo=datetime.timezone.utc),
+    "start_datetime": utc_date(2023, 1, 1),
+    "end_datetime": utc_date(9999, 12, 31),
     "collection_href": f"{S3_HTTP_BASE}/ULS_PRODUCTS/collection.json",
     "base_path": f"{S3_HTTP_BASE}/ULS_PRODUCTS",
     "license": "EUPL-1.2",
@@ -210,13 +210,7 @@ ULS_PRODUCTS_CFG = {
             "title": "ICOS Hainich flux tower metadata",
         },
     ],
-    "stac_extensions": [
-        "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/proj/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/file/v2.1.0/schema.json",
-        "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
-        "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
-    ],
+    "stac_extensions": COMMON_EXT,
     "summaries": {
         "temporal_resolution": ["campaign"],
         "variables": [
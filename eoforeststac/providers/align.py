@@ -4,14 +4,29 @@
 
 from __future__ import annotations
 
+import math
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Mapping, Optional, Tuple, Union
 
+import dask.array as dsa
+from dask.base import tokenize
+from dask.highlevelgraph import HighLevelGraph
 import numpy as np
 import xarray as xr
+import rasterio
 import rioxarray  # noqa: F401
 from affine import Affine
 from rasterio.enums import Resampling
+from rasterio.vrt import WarpedVRT
+from rasterio.warp import transform_bounds
+from rasterio.windows import Window, from_bounds
+from rasterio.windows import transform as window_transform
+from rioxarray.rioxarray import affine_to_coords
+
+from eoforeststac.core._crs import crs_to_string
 
 # -----------------------------------------------------------------------------
 # Resampling registry
@@ -76,6 +91,13 @@ class GridSpec:
 
     def hash(self, ndigits: int = 9) -> str:
         """Stable-ish hash for caching / diagnostics (rounded floats)."""
+        # memoized per instance and ndigits (frozen, so set via __dict__)
+        cache = self.__dict__.setdefault("_hash_cache", {})
+        if ndigits not in cache:
+            cache[ndigits] = self._compute_hash(ndigits)
+        return cache[ndigits]
+
+    def _compute_hash(self, ndigits: int) -> str:
         a, b, c, d, e, f = self.transform[:6]
         vals = (
             self.crs,
@@ -91,6 +113,18 @@ class GridSpec:
         return "grid:" + str(abs(hash(vals)))
 
 
+def _grid_hash_of(ds: xr.Dataset, crs: str) -> Optional[str]:
+    """GridSpec hash of a rioxarray-enabled dataset, or None if unavailable."""
+    try:
+        transform = Affine(*ds.rio.transform()[:6])
+        shape = tuple(ds.rio.shape)
+    except Exception:
+        return None
+    return GridSpec(
+        crs=crs, transform=transform, shape=(int(shape[0]), int(shape[1]))
+    ).hash()
+
+
 # -----------------------------------------------------------------------------
 # CRS & dimension utilities
 # -----------------------------------------------------------------------------
@@ -98,20 +132,18 @@ class GridSpec:
 
 def _infer_crs(obj: xr.Dataset | xr.DataArray) -> Optional[str]:
     """Infer CRS from rioxarray or CF grid-mapping metadata."""
-    if isinstance(obj, xr.DataArray):
-        obj = obj.to_dataset(name="_tmp")
-
     if hasattr(obj, "rio"):
         try:
             crs = obj.rio.crs
             if crs:
-                return crs.to_string()
+                return crs_to_string(obj, crs)
         except (AttributeError, TypeError):
             pass
 
+    variables = obj.variables if isinstance(obj, xr.Dataset) else obj.coords
     for name in ("spatial_ref", "crs"):
-        if name in obj.variables:
-            var = obj[name]
+        if name in variables:
+            var = variables[name]
             wkt = var.attrs.get("crs_wkt") or var.attrs.get("spatial_ref")
             if wkt:
                 return wkt
@@ -139,31 +171,52 @@ def _require_crs(ds: xr.Dataset, name: str) -> str:
     return crs
 
 
+# Spatial dim names in priority order, plus sets for the one-hit common case
+_X_DIM_CANDIDATES = ("x", "longitude", "lon")
+_Y_DIM_CANDIDATES = ("y", "latitude", "lat")
+_X_DIM_SET = frozenset(_X_DIM_CANDIDATES)
+_Y_DIM_SET = frozenset(_Y_DIM_CANDIDATES)
+
+
+def _pick_dim(
+    dims, candidates: Tuple[str, ...], candidate_set: frozenset
+) -> Optional[str]:
+    hits = candidate_set.intersection(dims)
+    if len(hits) == 1:
+        return next(iter(hits))
+    return next((name for name in candidates if name in hits), None)
+
+
 def _infer_x_dim(da: xr.DataArray) -> str:
-    for name in ("x", "longitude", "lon"):
-        if name in da.dims:
-            return name
-    raise ValueError("Could not infer x-dimension name.")
+    name = _pick_dim(da.dims, _X_DIM_CANDIDATES, _X_DIM_SET)
+    if name is None:
+        raise ValueError("Could not infer x-dimension name.")
+    return name
 
 
 def _infer_y_dim(da: xr.DataArray) -> str:
-    for name in ("y", "latitude", "lat"):
-        if name in da.dims:
-            return name
-    raise ValueError("Could not infer y-dimension name.")
+    name = _pick_dim(da.dims, _Y_DIM_CANDIDATES, _Y_DIM_SET)
+    if name is None:
+        raise ValueError("Could not infer y-dimension name.")
+    return name
+
+
+@lru_cache(maxsize=256)
+def _resolve_resampling(method: str) -> Optional[Resampling]:
+    return _RESAMPLING_MAP.get(method.lower())
 
 
 def _parse_resampling(method: Union[str, Resampling], *, what: str) -> Resampling:
     if isinstance(method, Resampling):
         return method
     if isinstance(method, str):
-        try:
-            return _RESAMPLING_MAP[method.lower()]
-        except KeyError:
+        resolved = _resolve_resampling(method)
+        if resolved is None:
             raise ValueError(
                 f"Invalid resampling method '{method}' for {what}. "
                 f"Valid options: {sorted(_RESAMPLING_MAP)}"
             )
+        return resolved
     raise TypeError(
         f"Invalid resampling method type for {what}: {type(method).__name__}"
     )
@@ -212,6 +265,79 @@ def _snap_resolution(
 # -----------------------------------------------------------------------------
 
 
+def _windows_last(x: np.ndarray, axis: Tuple[int, ...]) -> np.ndarray:
+    """Move coarsen window axes to the end and flatten them into one."""
+    axis = tuple(a % x.ndim for a in axis)
+    keep = [a for a in range(x.ndim) if a not in axis]
+    x = np.transpose(x, keep + list(axis))
+    return x.reshape(x.shape[: len(keep)] + (-1,))
+
+
+def _first_np(x: np.ndarray, axis: Tuple[int, ...]) -> np.ndarray:
+    return _windows_last(x, axis)[..., 0]
+
+
+def _mode_np(x: np.ndarray, axis: Tuple[int, ...]) -> np.ndarray:
+    """
+    Most frequent value per coarsen window (smallest value wins ties).
+
+    Small-range integers are counted with one flat ``np.bincount`` over all
+    windows, as long as the counts (windows x value range) fit in
+    ``_MODE_BINCOUNT_MAX_COUNTS``. Anything else is sorted per window and the
+    longest run of equal values is taken; NaNs never form runs, so all-NaN
+    windows return NaN.
+    """
+    w = _windows_last(np.asarray(x), axis)
+    if w.size == 0:
+        return w[..., 0] if w.shape[-1] else np.full(w.shape[:-1], np.nan)
+
+    if np.issubdtype(w.dtype, np.integer):
+        lo = int(w.min())
+        nbins = int(w.max()) - lo + 1
+        rows = w.reshape(-1, w.shape[-1])
+        if (
+            nbins <= _MODE_BINCOUNT_MAX_BINS
+            and rows.shape[0] * nbins <= _MODE_BINCOUNT_MAX_COUNTS
+        ):
+            offsets = np.arange(rows.shape[0], dtype=np.int64)[:, None] * nbins
+            flat = (rows.astype(np.int64) - lo + offsets).ravel()
+            counts = np.bincount(flat, minlength=rows.shape[0] * nbins)
+            best = counts.reshape(rows.shape[0], nbins).argmax(axis=1) + lo
+            return best.astype(w.dtype).reshape(w.shape[:-1])
+
+    srt = np.sort(w, axis=-1)
+    pos = np.arange(srt.shape[-1])
+    starts = np.ones(srt.shape, dtype=bool)
+    starts[..., 1:] = srt[..., 1:] != srt[..., :-1]
+    run_start = np.maximum.accumulate(np.where(starts, pos, 0), axis=-1)
+    best = np.argmax(pos - run_start, axis=-1)
+    return np.take_along_axis(srt, best[..., None], axis=-1)[..., 0]
+
+
+def _dask_window_reducer(func):
+    """Apply a numpy window reducer block-wise when coarsen hands us dask."""
+
+    def reducer(x, axis):
+        if isinstance(x, dsa.Array):
+            axis = tuple(a % x.ndim for a in axis)
+            x = x.rechunk({a: -1 for a in axis})
+            return x.map_blocks(func, axis=axis, drop_axis=axis, dtype=x.dtype)
+        return func(x, axis)
+
+    return reducer
+
+
+# Integer ranges up to this size use the bincount mode path
+_MODE_BINCOUNT_MAX_BINS = 1 << 16
+# Largest windows x bins count array for that path: 2**24 int64 = 128 MiB
+_MODE_BINCOUNT_MAX_COUNTS = 1 << 24
+
+_WINDOW_REDUCERS = {
+    "first": _dask_window_reducer(_first_np),
+    "mode": _dask_window_reducer(_mode_np),
+}
+
+
 def _coarsen_dataset(
     ds: xr.Dataset,
     *,
@@ -265,19 +391,9 @@ def _coarsen_dataset(
             co = da.coarsen(dim=dim, boundary="pad", coord_func="min")
             method = pick_agg(name, da)
 
-            if method == "mode":
-                # xarray has no builtin mode reducer; use apply_ufunc on blocks
-                def _mode_np(x, axis=-1):
-                    # flatten along coarsen reduction dims handled by coarsen.reduce, so axis provided
-                    # simple, robust-ish fallback: nan-safe mode using unique counts
-                    x = np.asarray(x)
-                    x = x[~np.isnan(x)] if np.issubdtype(x.dtype, np.floating) else x
-                    if x.size == 0:
-                        return np.nan
-                    vals, counts = np.unique(x, return_counts=True)
-                    return vals[np.argmax(counts)]
-
-                da2 = co.reduce(_mode_np)
+            if method in _WINDOW_REDUCERS:
+                # xarray has no builtin first/mode coarsen reducers
+                da2 = co.reduce(_WINDOW_REDUCERS[method])
             else:
                 da2 = getattr(co, method)()
 
@@ -296,18 +412,7 @@ def _coarsen_dataset(
         else:
             out_vars[name] = da
 
-    out = xr.Dataset(out_vars, attrs=ds.attrs)
-
-    if new_coords:
-        out = xr.Dataset(
-            {
-                k: v.assign_coords(
-                    {d: new_coords[d] for d in v.dims if d in new_coords}
-                )
-                for k, v in out.data_vars.items()
-            },
-            attrs=out.attrs,
-        )
+    out = xr.Dataset(out_vars, coords=new_coords, attrs=ds.attrs)
 
     # Re-attach CRS if present
     if ds.rio.crs:
@@ -316,6 +421,556 @@ def _coarsen_dataset(
     return out
 
 
+# -----------------------------------------------------------------------------
+# Reprojection (eager, or lazy for dask-backed inputs)
+# -----------------------------------------------------------------------------
+
+
+def _reproject_block(
+    block: xr.Dataset,
+    x_dim: str,
+    y_dim: str,
+    crs: str,
+    transform: Affine,
+    shape: Tuple[int, int],
+    resampling: Resampling,
+) -> xr.Dataset:
+    block = block.rio.set_spatial_dims(x_dim=x_dim, y_dim=y_dim, inplace=False)
+    return block.rio.reproject(
+        crs, transform=transform, shape=shape, resampling=resampling
+    )
+
+
+# Source pixels read around each output chunk's footprint, per unit of
+# resampling kernel radius (scaled by the dst/src pixel ratio when
+# downsampling), so kernels at chunk edges see the same inputs as a full warp
+_KERNEL_RADIUS = {
+    Resampling.nearest: 1,
+    Resampling.bilinear: 1,
+    Resampling.cubic: 2,
+    Resampling.cubic_spline: 2,
+    Resampling.lanczos: 3,
+}
+
+
+def _split(size: int, step: int) -> list:
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _source_footprint(
+    src_transform: Affine,
+    src_crs: str,
+    dst_transform: Affine,
+    dst_crs: str,
+    rows: Tuple[int, int],
+    cols: Tuple[int, int],
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Fractional source (row_min, row_max, col_min, col_max) under the output
+    rows/cols, or None when the footprint cannot be transformed.
+    """
+    (r0, r1), (c0, c1) = rows, cols
+    left, top = dst_transform * (c0, r0)
+    right, bottom = dst_transform * (c1, r1)
+    try:
+        left, bottom, right, top = transform_bounds(
+            dst_crs,
+            src_crs,
+            min(left, right),
+            min(bottom, top),
+            max(left, right),
+            max(bottom, top),
+            densify_pts=21,
+        )
+    except Exception:
+        return None
+    if left > right:
+        return None
+
+    inv = ~src_transform
+    corners = [inv * (x, y) for x in (left, right) for y in (bottom, top)]
+    px = [c for c, _ in corners]
+    py = [r for _, r in corners]
+    return min(py), max(py), min(px), max(px)
+
+
+def _source_window(
+    footprint: Optional[Tuple[float, float, float, float]],
+    src_shape: Tuple[int, int],
+    margin: int,
+) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Integer source (rows, cols) for a footprint, widened by ``margin`` pixels
+    and at least 2x2 (rio.reproject derives the source transform from the
+    coordinates); the whole source when the footprint is unknown.
+    """
+    height, width = src_shape
+    if footprint is None:
+        return (0, height), (0, width)
+    row_min, row_max, col_min, col_max = footprint
+
+    def clamp(lo, hi, size):
+        lo = min(max(math.floor(lo) - margin, 0), size - 2)
+        hi = min(max(math.ceil(hi) + margin, lo + 2), size)
+        return lo, hi
+
+    return clamp(row_min, row_max, height), clamp(col_min, col_max, width)
+
+
+def _warp_window(
+    blocks: list,
+    offsets: Tuple[int, int, int, int],
+    y: np.ndarray,
+    x: np.ndarray,
+    dims: Tuple[str, ...],
+    out_dims: Tuple[str, ...],
+    attrs: dict,
+    encoding: dict,
+    src_crs: str,
+    crs: str,
+    transform: Affine,
+    shape: Tuple[int, int],
+    resampling: Resampling,
+    scale: Tuple[float, float],
+) -> np.ndarray:
+    """Warp one source window (a grid of dask blocks) onto one output chunk."""
+    data = np.concatenate([np.concatenate(row, axis=-1) for row in blocks], axis=-2)
+    oy, ox, h, w = offsets
+    da = xr.DataArray(
+        data[..., oy : oy + h, ox : ox + w],
+        dims=dims,
+        coords={dims[-2]: y, dims[-1]: x},
+        attrs=attrs,
+    )
+    da.encoding = encoding
+    da = da.rio.write_crs(src_crs).rio.set_spatial_dims(
+        x_dim=dims[-1], y_dim=dims[-2], inplace=False
+    )
+    # GDAL derives the kernel scale from each warp's src/dst window ratio;
+    # pin it to the full warp's ratio so every chunk resamples alike
+    out = da.rio.reproject(
+        crs,
+        transform=transform,
+        shape=shape,
+        resampling=resampling,
+        XSCALE=scale[1],
+        YSCALE=scale[0],
+    )
+    return out.transpose(*out_dims).values
+
+
+def _reproject_lazy_var(
+    da: xr.DataArray,
+    out: xr.DataArray,
+    *,
+    x_dim: str,
+    y_dim: str,
+    src_crs: str,
+    crs: str,
+    transform: Affine,
+    shape: Tuple[int, int],
+    chunks: Tuple[int, int],
+    resampling: Resampling,
+) -> dsa.Array:
+    """
+    One dask layer warping ``da`` chunk by chunk: each output chunk depends
+    only on the source blocks under its footprint (plus a kernel margin).
+    """
+    lead = tuple(d for d in out.dims if d not in ("y", "x"))
+    src = da.transpose(*lead, y_dim, x_dim)
+    data = src.data
+    height, width = shape
+    src_shape = (src.sizes[y_dim], src.sizes[x_dim])
+    src_transform = src.rio.set_spatial_dims(
+        x_dim=x_dim, y_dim=y_dim, inplace=False
+    ).rio.transform(recalc=True)
+    ys, xs = src[y_dim].values, src[x_dim].values
+
+    # destination pixels per source pixel over the whole output
+    full = _source_footprint(
+        src_transform, src_crs, transform, crs, (0, height), (0, width)
+    )
+    if full is None:
+        scale = (height / src_shape[0], width / src_shape[1])
+    else:
+        row_min, row_max, col_min, col_max = full
+        span_y = min(row_max, src_shape[0]) - max(row_min, 0)
+        span_x = min(col_max, src_shape[1]) - max(col_min, 0)
+        scale = (
+            height / span_y if span_y > 0 else 1.0,
+            width / span_x if span_x > 0 else 1.0,
+        )
+    margin = (_KERNEL_RADIUS.get(resampling, 1) + 1) * math.ceil(
+        1.0 / min(1.0, *scale)
+    )
+
+    # block boundaries of the source along y/x
+    bounds_y = np.cumsum((0,) + data.chunks[-2])
+    bounds_x = np.cumsum((0,) + data.chunks[-1])
+
+    def block_range(bounds, lo, hi):
+        first = int(np.searchsorted(bounds, lo, side="right")) - 1
+        last = int(np.searchsorted(bounds, hi, side="left"))
+        return first, last
+
+    out_dims = lead + ("y", "x")
+    row_tiles = _split(height, chunks[0])
+    col_tiles = _split(width, chunks[1])
+    token = tokenize(data, src_crs, crs, transform, shape, chunks, resampling)
+    name = f"reproject-{token}"
+
+    dsk = {}
+    for lead_idx in np.ndindex(*data.numblocks[:-2]):
+        for i, rows in enumerate(row_tiles):
+            for j, cols in enumerate(col_tiles):
+                footprint = _source_footprint(
+                    src_transform, src_crs, transform, crs, rows, cols
+                )
+                (sr0, sr1), (sc0, sc1) = _source_window(footprint, src_shape, margin)
+                by0, by1 = block_range(bounds_y, sr0, sr1)
+                bx0, bx1 = block_range(bounds_x, sc0, sc1)
+                blocks = [
+                    [(data.name, *lead_idx, by, bx) for bx in range(bx0, bx1)]
+                    for by in range(by0, by1)
+                ]
+                offsets = (
+                    sr0 - int(bounds_y[by0]),
+                    sc0 - int(bounds_x[bx0]),
+                    sr1 - sr0,
+                    sc1 - sc0,
+                )
+                tile_transform = transform * Affine.translation(cols[0], rows[0])
+                dsk[(name, *lead_idx, i, j)] = (
+                    _warp_window,
+                    blocks,
+                    offsets,
+                    ys[sr0:sr1],
+                    xs[sc0:sc1],
+                    src.dims,
+                    out_dims,
+                    dict(da.attrs),
+                    dict(da.encoding),
+                    src_crs,
+                    crs,
+                    tile_transform,
+                    (rows[1] - rows[0], cols[1] - cols[0]),
+                    resampling,
+                    scale,
+                )
+
+    out_chunks = tuple(data.chunks[:-2]) + (
+        tuple(r1 - r0 for r0, r1 in row_tiles),
+        tuple(c1 - c0 for c0, c1 in col_tiles),
+    )
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[data])
+    arr = dsa.Array(graph, name, out_chunks, dtype=out.dtype)
+    return arr.transpose([out_dims.index(d) for d in out.dims])
+
+
+def _reproject_dataset(
+    ds: xr.Dataset,
+    crs: str,
+    *,
+    x_dim: str,
+    y_dim: str,
+    transform: Affine,
+    shape: Tuple[int, int],
+    resampling: Resampling,
+    lazy: bool = False,
+    chunks: Optional[Tuple[int, int]] = None,
+) -> xr.Dataset:
+    """
+    ``ds.rio.reproject`` onto (transform, shape); with ``lazy`` the warp is
+    deferred into one dask layer per variable.
+
+    rio.reproject pulls ``.values`` and would compute dask inputs on the spot.
+    The lazy path splits the output into ``chunks`` (y, x) tiles (one tile
+    when None) and warps each from the source blocks under its footprint,
+    widened by the resampling kernel, so no task holds the whole raster.
+    Kernel-based methods (bilinear, cubic, ...) use the full warp's scale,
+    but can still differ from the eager warp at float-rounding level.
+    Output dims, dtype, nodata attrs and encoding come from warping an
+    all-zero 2x2 stub onto a 1x1 grid, without touching the source data.
+    """
+    if not lazy or ds.sizes[x_dim] < 2 or ds.sizes[y_dim] < 2:
+        return _reproject_block(ds, x_dim, y_dim, crs, transform, shape, resampling)
+
+    src_crs = ds.rio.crs
+    stub = xr.zeros_like(
+        ds.isel(
+            {d: slice(0, 2) if d in (x_dim, y_dim) else slice(0, 1) for d in ds.dims}
+        )
+    ).compute()
+    for name, da in ds.data_vars.items():
+        stub[name].encoding = dict(da.encoding)
+    stub_out = _reproject_block(stub, x_dim, y_dim, crs, transform, (1, 1), resampling)
+
+    height, width = shape
+    out_vars = {}
+    for name, da in stub_out.data_vars.items():
+        src_da = ds[name]
+        if src_da.chunks is None:
+            src_da = src_da.chunk()
+        out_vars[name] = xr.DataArray(
+            _reproject_lazy_var(
+                src_da,
+                da,
+                x_dim=x_dim,
+                y_dim=y_dim,
+                src_crs=src_crs,
+                crs=crs,
+                transform=transform,
+                shape=shape,
+                chunks=chunks or shape,
+                resampling=resampling,
+            ),
+            dims=da.dims,
+            attrs=da.attrs,
+        )
+        out_vars[name].encoding = da.encoding
+
+    coords = {
+        k: v
+        for k, v in ds.coords.items()
+        if x_dim not in v.dims and y_dim not in v.dims
+    }
+    coords.update({k: v for k, v in stub_out.coords.items() if k not in coords})
+    coords.update(affine_to_coords(transform, width, height))
+    return xr.Dataset(out_vars, coords=coords, attrs=stub_out.attrs)
+
+
+# -----------------------------------------------------------------------------
+# Lazy reprojection from file-backed variables
+# -----------------------------------------------------------------------------
+
+
+# Dask layers that only read (and index) a file opened by rioxarray
+_FILE_READ_LAYERS = ("original-open_rasterio", "open_rasterio", "getitem")
+
+
+def _reads_file_unmodified(da: xr.DataArray) -> bool:
+    """
+    Whether ``da`` still holds exactly what rioxarray read from its file:
+    its lazy backend array (possibly cached in memory), or a dask graph of
+    read/indexing layers only.
+    """
+    if da.chunks is not None:
+        layers = da.data.__dask_graph__().layers
+        return all(name.startswith(_FILE_READ_LAYERS) for name in layers)
+    # where()/astype()/arithmetic replace the backend array with a plain ndarray
+    return not isinstance(da.variable._data, np.ndarray)
+
+
+def _open_warped(
+    da: xr.DataArray,
+    grid: GridSpec,
+    resampling: Resampling,
+    chunks: Optional[Tuple[int, int]],
+) -> Optional[xr.DataArray]:
+    """
+    Open the raster file behind ``da`` through a WarpedVRT on ``grid``.
+
+    Pixels are resampled on read, window by window, so no full-resolution
+    intermediate array is built. The file is read with the same masking and
+    scaling as ``da``. Returns None when ``da`` has no file source, its band
+    layout cannot be matched, or it no longer holds the file's pixels as
+    read (subset, cast, masked or loaded and modified in memory): warping
+    the file would then silently drop those changes.
+    """
+    source = da.encoding.get("source")
+    if not source or not _reads_file_unmodified(da):
+        return None
+
+    # rioxarray records mask_and_scale in encoding (scale_factor/add_offset)
+    # and masked (dtype, plus _FillValue when the file has nodata)
+    scaled = "scale_factor" in da.encoding or "add_offset" in da.encoding
+    masked = scaled or "_FillValue" in da.encoding or "dtype" in da.encoding
+
+    # src/vrt only describe the warp: rioxarray reopens the file through its
+    # own file manager, whose close() is kept reachable from the result
+    with rasterio.open(source) as src:
+        if "band" in da.dims:
+            band = None
+            if da.sizes["band"] != src.count:
+                return None
+        elif "band" in da.coords and da.coords["band"].ndim == 0:
+            band = int(da.coords["band"])
+        elif src.count == 1:
+            band = 1
+        else:
+            return None
+
+        try:
+            shape = tuple(da.rio.shape)
+            transform = da.rio.transform(recalc=True)
+        except Exception:
+            return None
+        if shape != (src.height, src.width) or not transform.almost_equals(
+            src.transform
+        ):
+            return None
+
+        with WarpedVRT(
+            src,
+            crs=grid.crs,
+            transform=grid.transform,
+            width=grid.width,
+            height=grid.height,
+            resampling=resampling,
+        ) as vrt:
+            raw = rioxarray.open_rasterio(
+                vrt,
+                chunks={"y": chunks[0], "x": chunks[1]} if chunks else None,
+                masked=masked,
+                mask_and_scale=scaled,
+            )
+    if raw.dtype != da.dtype:
+        raw.close()
+        return None
+    out = raw.sel(band=band, drop=True) if band is not None else raw
+    out.attrs.update(da.attrs)
+    out = out.rename(da.name)
+    out.set_close(raw.close)
+    return out
+
+
+# -----------------------------------------------------------------------------
+# Source/target overlap
+# -----------------------------------------------------------------------------
+
+
+# Resampling methods whose per-pixel result does not depend on the warp
+# extent. GDAL sizes kernel and statistic footprints from the src/dst window
+# ratio, so the other methods can differ near edges when the warp is clipped.
+_EXTENT_INDEPENDENT = frozenset({Resampling.nearest})
+
+
+def _overlap_window(ds: xr.Dataset, crs: str, grid: GridSpec) -> Optional[Window]:
+    """
+    Window of ``grid`` covered by the footprint of ``ds`` (plus one pixel).
+
+    Returns None when the footprints do not intersect. If the bounds cannot
+    be transformed (or wrap the antimeridian) the full grid is returned.
+    """
+    full = Window(0, 0, grid.width, grid.height)
+    try:
+        left, bottom, right, top = transform_bounds(
+            crs, grid.crs, *ds.rio.bounds(), densify_pts=21
+        )
+    except Exception:
+        return full
+    if left > right:
+        return full
+
+    win = from_bounds(left, bottom, right, top, transform=grid.transform)
+    c0 = max(0, math.floor(win.col_off) - 1)
+    r0 = max(0, math.floor(win.row_off) - 1)
+    c1 = min(grid.width, math.ceil(win.col_off + win.width) + 1)
+    r1 = min(grid.height, math.ceil(win.row_off + win.height) + 1)
+    if c1 <= c0 or r1 <= r0:
+        return None
+    return Window(c0, r0, c1 - c0, r1 - r0)
+
+
+def _pad_to_grid(ds: xr.Dataset, grid: GridSpec, window: Window) -> xr.Dataset:
+    """Pad a dataset warped onto ``window`` out to the full grid with nodata."""
+    r0, c0 = int(window.row_off), int(window.col_off)
+    h, w = int(window.height), int(window.width)
+    if (r0, c0, h, w) == (0, 0, grid.height, grid.width):
+        return ds
+
+    x_dim, y_dim = ds.rio.x_dim, ds.rio.y_dim
+    pad = {
+        y_dim: (r0, grid.height - r0 - h),
+        x_dim: (c0, grid.width - c0 - w),
+    }
+
+    padded = {}
+    for name, da in ds.data_vars.items():
+        nodata = da.rio.nodata
+        if nodata is None:
+            nodata = da.rio.encoded_nodata
+        fill = np.nan if nodata is None else nodata
+        da_pad = da.pad(pad, mode="constant", constant_values=fill)
+        if da_pad.dtype != da.dtype:
+            da_pad = da_pad.astype(da.dtype)
+        da_pad.attrs = da.attrs
+        da_pad.encoding = da.encoding
+        padded[name] = da_pad
+
+    coords = affine_to_coords(
+        grid.transform, grid.width, grid.height, x_dim=x_dim, y_dim=y_dim
+    )
+    out = xr.Dataset(padded, attrs=ds.attrs).assign_coords(coords)
+    return out.rio.set_spatial_dims(x_dim=x_dim, y_dim=y_dim, inplace=False)
+
+
+# -----------------------------------------------------------------------------
+# Dtype narrowing before reprojection
+# -----------------------------------------------------------------------------
+
+
+def _auto_dtype(da: xr.DataArray) -> Optional[np.dtype]:
+    """
+    "auto" policy: float64 -> float32, and int64 -> int32 when the values fit
+    (checked only for in-memory arrays).
+    """
+    if da.dtype == np.float64:
+        return np.dtype(np.float32)
+    if da.dtype == np.int64 and da.chunks is None and da.size:
+        info = np.iinfo(np.int32)
+        values = da.values
+        if info.min <= values.min() and values.max() <= info.max:
+            return np.dtype(np.int32)
+    return None
+
+
+def _nodata_fits(nodata: float, dtype: np.dtype) -> bool:
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return float(nodata).is_integer() and info.min <= nodata <= info.max
+    return bool(np.isnan(nodata)) or abs(nodata) <= np.finfo(dtype).max
+
+
+def _apply_dtype_policy(
+    ds: xr.Dataset, policy: Union[str, Mapping[str, str]]
+) -> xr.Dataset:
+    """
+    Cast variables per ``policy`` before the warp.
+
+    policy:
+      - "auto": see _auto_dtype
+      - str: numpy dtype name applied to every variable
+      - mapping: per-variable dtype (or "auto"); "*" matches any variable
+
+    Variables whose nodata value does not fit the new dtype are left as-is.
+    """
+    if isinstance(policy, str):
+        policy = {"*": policy}
+
+    cast: dict[str, xr.DataArray] = {}
+    for name, da in ds.data_vars.items():
+        spec = policy.get(name, policy.get("*"))
+        if spec is None:
+            continue
+        dtype = _auto_dtype(da) if spec == "auto" else np.dtype(spec)
+        if dtype is None or dtype == da.dtype:
+            continue
+
+        nodata = da.rio.nodata
+        if nodata is not None and not _nodata_fits(nodata, dtype):
+            continue
+
+        da_cast = da.astype(dtype, copy=False)
+        if nodata is not None:
+            da_cast = da_cast.rio.write_nodata(
+                dtype.type(nodata), encoded=False, inplace=False
+            )
+        cast[name] = da_cast
+
+    return ds.assign(cast) if cast else ds
+
+
 # -----------------------------------------------------------------------------
 # Dataset aligner
 # -----------------------------------------------------------------------------
@@ -333,6 +988,10 @@ class DatasetAligner:
     - Automatic resolution snapping (optional)
     - Per-dataset and per-variable resampling overrides
     - Optional coarsening before reprojection (fast-downsample)
+    - Lazy, chunk-windowed reprojection for dask-backed inputs
+    - Optional WarpedVRT reads for file-backed variables (lazy reprojection)
+    - Optional thread pool across datasets for eager inputs
+    - Optional dtype narrowing before the warp (dtype_policy)
     - Strict merge semantics
     """
 
@@ -348,6 +1007,10 @@ class DatasetAligner:
         coarsen_factor: int = 1,
         coarsen_agg: Union[str, Mapping[str, str]] = "auto",
         canonical_spatial_dims: Tuple[str, str] = ("longitude", "latitude"),
+        reproject_chunks: Optional[Tuple[int, int]] = (512, 512),
+        use_warped_vrt: bool = False,
+        max_workers: int = 1,
+        dtype_policy: Optional[Union[str, Mapping[str, str]]] = None,
     ):
         if target is None and crs is None:
             raise ValueError("Either 'target' or 'crs' must be provided.")
@@ -366,8 +1029,22 @@ class DatasetAligner:
 
         self.x_out, self.y_out = canonical_spatial_dims
 
+        # (y, x) output chunk size for dask-backed or VRT results; None disables
+        self.reproject_chunks = reproject_chunks
+
+        # Read file-backed variables through a WarpedVRT instead of rio.reproject
+        self.use_warped_vrt = use_warped_vrt
+
+        # Threads used to reproject eager (non-dask) datasets concurrently
+        self.max_workers = int(max_workers)
+
+        # Per-variable dtypes applied before reprojection; None keeps inputs as-is
+        self.dtype_policy = dtype_policy
+
         # Cached for diagnostics / reuse
         self._grid: Optional[GridSpec] = None
+        self._grid_ref: Optional[weakref.ref] = None
+        self._grid_key: Optional[tuple] = None
 
     # -------------------------------------------------------------------------
     # Target grid resolution
@@ -387,6 +1064,22 @@ class DatasetAligner:
             )
 
         ref = datasets[self.target_key]
+
+        # Reuse the grid when align() is called again with the same reference
+        key = (
+            self.target_crs,
+            self.target_resolution,
+            self.snap_resolution_mode,
+            self.snap_tolerance,
+        )
+        if (
+            self._grid is not None
+            and self._grid_ref is not None
+            and self._grid_ref() is ref
+            and self._grid_key == key
+        ):
+            return self._grid
+
         crs = _require_crs(ref, self.target_key)
 
         if not hasattr(ref, "rio"):
@@ -415,8 +1108,11 @@ class DatasetAligner:
                     float(self.target_resolution[1]),
                 )
 
+            # Unpack the reference affine once
+            a, _, x0, _, e, y0 = transform[:6]
+
             # Snap requested resolution to ref resolution if desired
-            ref_res = (float(transform.a), float(abs(transform.e)))
+            ref_res = (float(a), float(abs(e)))
             req_res = _snap_resolution(
                 req_res,
                 ref_res,
@@ -426,9 +1122,8 @@ class DatasetAligner:
 
             # Keep same extent as reference grid; recompute width/height
             # Extent from affine + shape
-            x0, y0 = transform.c, transform.f
-            x1 = x0 + transform.a * shape[1]
-            y1 = y0 + transform.e * shape[0]
+            x1 = x0 + a * shape[1]
+            y1 = y0 + e * shape[0]
 
             width = int(round(abs((x1 - x0) / req_res[0])))
             height = int(round(abs((y1 - y0) / req_res[1])))
@@ -448,6 +1143,8 @@ class DatasetAligner:
             y_dim=self.y_out,
         )
         self._grid = grid
+        self._grid_ref = weakref.ref(ref)
+        self._grid_key = key
         return grid
 
     @property
@@ -500,85 +1197,208 @@ class DatasetAligner:
     # Public API
     # -------------------------------------------------------------------------
 
-    def align(self, datasets: Dict[str, xr.Dataset]) -> xr.Dataset:
-        if not datasets:
-            raise ValueError("No datasets provided for alignment.")
+    def _align_one(self, key: str, ds: xr.Dataset, grid: GridSpec) -> xr.Dataset:
+        """Reproject one input dataset onto ``grid`` with canonical dim names."""
+        if not isinstance(ds, xr.Dataset):
+            raise TypeError(
+                f"Expected xr.Dataset for '{key}', got {type(ds).__name__}"
+            )
 
-        grid = self._resolve_target_grid(datasets)
+        if not ds.data_vars:
+            raise ValueError(f"Dataset '{key}' has no data variables to align.")
+
+        ds_crs = _require_crs(ds, key)
+
+        # write CRS once at dataset level: the spatial_ref coord is shared
+        # by every variable and grid_mapping is set on each of them
+        ds = ds.rio.write_crs(ds_crs, inplace=False)
+
+        # infer spatial dims once
+        sample = next(iter(ds.data_vars.values()))
+        x_dim = _infer_x_dim(sample)
+        y_dim = _infer_y_dim(sample)
+        ds = ds.rio.set_spatial_dims(x_dim=x_dim, y_dim=y_dim, inplace=False)
+
+        # optional pre-coarsening (fast downsample)
+        if self.coarsen_factor and self.coarsen_factor > 1:
+            ds = _coarsen_dataset(
+                ds,
+                x_dim=x_dim,
+                y_dim=y_dim,
+                factor=self.coarsen_factor,
+                agg=self.coarsen_agg,
+            )
 
-        aligned: list[xr.Dataset] = []
+        # optional dtype narrowing so the warp moves fewer bytes
+        if self.dtype_policy is not None:
+            ds = _apply_dtype_policy(ds, self.dtype_policy)
 
-        for key, ds in datasets.items():
+        # coarsening and casting rebuild the dataset, which drops rio's dims
+        ds = ds.rio.set_spatial_dims(x_dim=x_dim, y_dim=y_dim, inplace=False)
 
-            if not isinstance(ds, xr.Dataset):
-                raise TypeError(
-                    f"Expected xr.Dataset for '{key}', got {type(ds).__name__}"
+        # fast path: source already sits on the target grid
+        if _grid_hash_of(ds, ds_crs) == grid.hash():
+            # use grid-derived coords so they match reprojected datasets exactly
+            ds_same = ds.assign_coords(
+                affine_to_coords(
+                    grid.transform, grid.width, grid.height, x_dim=x_dim, y_dim=y_dim
                 )
-
-            if not ds.data_vars:
-                raise ValueError(f"Dataset '{key}' has no data variables to align.")
-
-            ds_crs = _require_crs(ds, key)
-
-            if not ds.rio.crs:
-                ds = ds.rio.write_crs(ds_crs, inplace=False)
-
-            # infer spatial dims once
-            sample = next(iter(ds.data_vars.values()))
-            x_dim = _infer_x_dim(sample)
-            y_dim = _infer_y_dim(sample)
-            ds = ds.rio.set_spatial_dims(x_dim=x_dim, y_dim=y_dim, inplace=False)
-
-            # Ensure CRS is written on every spatial variable
-            for name, da in ds.data_vars.items():
-                if da.rio.crs is None:
-                    ds[name] = da.rio.write_crs(ds.rio.crs, inplace=False)
-
-            # optional pre-coarsening (fast downsample)
-            if self.coarsen_factor and self.coarsen_factor > 1:
-                ds = _coarsen_dataset(
-                    ds,
-                    x_dim=x_dim,
-                    y_dim=y_dim,
-                    factor=self.coarsen_factor,
-                    agg=self.coarsen_agg,
+            )
+            if (x_dim, y_dim) != (grid.x_dim, grid.y_dim):
+                ds_same = ds_same.rename({x_dim: grid.x_dim, y_dim: grid.y_dim})
+            return ds_same.rio.write_crs(grid.crs)
+
+        # resampling: dataset default + per-variable overrides
+        ds_default_resampling, per_var = self._get_dataset_resampling(key)
+
+        # dask inputs are warped lazily, one output chunk per task
+        is_dask = any(da.chunks is not None for da in ds.data_vars.values())
+
+        # 0) optionally warp file-backed variables lazily on read
+        # (coarsened variables no longer match their source file)
+        warped: dict[str, xr.DataArray] = {}
+        if self.use_warped_vrt and self.coarsen_factor <= 1:
+            for var_name, da in ds.data_vars.items():
+                da_warped = _open_warped(
+                    da,
+                    grid,
+                    per_var.get(var_name, ds_default_resampling),
+                    self.reproject_chunks,
                 )
-
-            # resampling: dataset default + per-variable overrides
-            ds_default_resampling, per_var = self._get_dataset_resampling(key)
-
+                if da_warped is not None:
+                    warped[var_name] = da_warped
+
+        remaining = [name for name in ds.data_vars if name not in warped]
+
+        # clip the warp to the part of the target grid the source covers;
+        # with no overlap, warp a single pixel and let padding fill the rest
+        window = _overlap_window(ds, ds_crs, grid)
+        if window is None:
+            window = Window(0, 0, 1, 1)
+        elif not _EXTENT_INDEPENDENT.issuperset(
+            [ds_default_resampling, *per_var.values()]
+        ):
+            window = Window(0, 0, grid.width, grid.height)
+        dst_transform = window_transform(window, grid.transform)
+        dst_shape = (int(window.height), int(window.width))
+
+        ds_reproj = None
+        if remaining:
             # 1) reproject dataset with default resampling
-            ds_reproj = ds.rio.reproject(
+            ds_reproj = _reproject_dataset(
+                ds[remaining],
                 grid.crs,
-                transform=grid.transform,
-                shape=grid.shape,
+                x_dim=x_dim,
+                y_dim=y_dim,
+                transform=dst_transform,
+                shape=dst_shape,
                 resampling=ds_default_resampling,
+                lazy=is_dask,
+                chunks=self.reproject_chunks,
             )
 
             # 2) optionally override some variables with different resampling
-            # (reproject only those variables and then replace)
-            if per_var:
-                for var_name, var_resampling in per_var.items():
-                    if var_name not in ds.data_vars:
-                        continue
-                    da = ds[var_name]
-                    da_reproj = da.rio.reproject(
-                        grid.crs,
-                        transform=grid.transform,
-                        shape=grid.shape,
-                        resampling=var_resampling,
-                    )
-                    ds_reproj[var_name] = da_reproj
+            # (one reproject per distinct method, then replace)
+            overrides: dict[Resampling, list[str]] = {}
+            for var_name, var_resampling in per_var.items():
+                if (
+                    var_name in remaining
+                    and var_resampling != ds_default_resampling
+                ):
+                    overrides.setdefault(var_resampling, []).append(var_name)
+
+            for var_resampling, var_names in overrides.items():
+                sub_reproj = _reproject_dataset(
+                    ds[var_names],
+                    grid.crs,
+                    x_dim=x_dim,
+                    y_dim=y_dim,
+                    transform=dst_transform,
+                    shape=dst_shape,
+                    resampling=var_resampling,
+                    lazy=is_dask,
+                    chunks=self.reproject_chunks,
+                )
+                for var_name in var_names:
+                    ds_reproj[var_name] = sub_reproj[var_name]
+
+            ds_reproj = _pad_to_grid(ds_reproj, grid, window)
 
-            # canonical naming
-            ds_reproj = ds_reproj.rename(
+        if warped:
+            if ds_reproj is None:
+                ds_reproj = xr.Dataset(warped, attrs=ds.attrs)
+                ds_reproj = ds_reproj.rio.set_spatial_dims(
+                    x_dim="x", y_dim="y", inplace=False
+                )
+            else:
+                for var_name, da_warped in warped.items():
+                    ds_reproj[var_name] = da_warped
+                ds_reproj = ds_reproj[list(ds.data_vars)]
+
+        # canonical naming (skip the copy when names already match)
+        rename_map = {
+            src: dst
+            for src, dst in (
+                (ds_reproj.rio.x_dim, grid.x_dim),
+                (ds_reproj.rio.y_dim, grid.y_dim),
+            )
+            if src != dst
+        }
+        if rename_map:
+            ds_reproj = ds_reproj.rename(rename_map)
+
+        ds_reproj = ds_reproj.rio.write_crs(grid.crs)
+        if is_dask and self.reproject_chunks:
+            ds_reproj = ds_reproj.chunk(
                 {
-                    ds_reproj.rio.x_dim: grid.x_dim,
-                    ds_reproj.rio.y_dim: grid.y_dim,
+                    grid.y_dim: self.reproject_chunks[0],
+                    grid.x_dim: self.reproject_chunks[1],
                 }
             )
+        if warped:
+            ds_reproj.set_close(lambda: [da.close() for da in warped.values()])
+        return ds_reproj
+
+    def align(self, datasets: Dict[str, xr.Dataset]) -> xr.Dataset:
+        if not datasets:
+            raise ValueError("No datasets provided for alignment.")
 
-            ds_reproj = ds_reproj.rio.write_crs(grid.crs)
-            aligned.append(ds_reproj)
+        grid = self._resolve_target_grid(datasets)
 
-        return xr.merge(aligned, compat="no_conflicts")
+        # GDAL warps release the GIL, so eager inputs can be reprojected in
+        # threads; dask-backed inputs are left to the dask scheduler
+        is_dask = any(
+            da.chunks is not None
+            for ds in datasets.values()
+            if isinstance(ds, xr.Dataset)
+            for da in ds.data_vars.values()
+        )
+        if self.max_workers > 1 and len(datasets) > 1 and not is_dask:
+            workers = min(self.max_workers, len(datasets))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                aligned = list(
+                    pool.map(
+                        lambda item: self._align_one(item[0], item[1], grid),
+                        datasets.items(),
+                    )
+                )
+        else:
+            aligned = [self._align_one(key, ds, grid) for key, ds in datasets.items()]
+
+        # every input now sits on the same grid; value-level conflict checks
+        # are only needed when variable names repeat across datasets
+        names = [name for ds in aligned for name in ds.data_vars]
+        compat = "override" if len(names) == len(set(names)) else "no_conflicts"
+        # the spatial indexes all come from one GridSpec: a mismatch is a bug,
+        # so raise instead of padding; other dims (e.g. time) may differ
+        other_dims = {
+            d for ds in aligned for d in ds.dims if d not in (grid.x_dim, grid.y_dim)
+        }
+        merged = xr.merge(
+            xr.align(*aligned, join="exact", exclude=other_dims),
+            join="outer",
+            compat=compat,
+        )
+        # align/merge drop the per-input closers (e.g. WarpedVRT file handles)
+        merged.set_close(lambda: [ds.close() for ds in aligned])
+        return merged
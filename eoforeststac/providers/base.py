@@ -1,8 +1,93 @@
-import json
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import fsspec
+import orjson
 import pystac
+from pystac.utils import make_absolute_href
+
+# Concurrent GETs used to prefetch STAC JSON (latency bound, not CPU bound)
+_PREFETCH_WORKERS = 16
+# STAC JSON documents kept in memory per provider
+_TEXT_CACHE_SIZE = 4096
+# Botocore client settings for reads: enough pooled keep-alive connections for
+# the concurrent prefetch/Zarr reads, adaptive retries for a busy endpoint
+_S3_CONFIG_KWARGS = {
+    "max_pool_connections": 64,
+    "tcp_keepalive": True,
+    "retries": {"mode": "adaptive", "max_attempts": 5},
+}
+# Read-ahead block for file-like opens (large sequential reads)
+_S3_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class _LRU:
+    """Bounded, thread-safe href -> value cache (STAC text, opened datasets)."""
+
+    def __init__(self, maxsize: int):
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __contains__(self, href: str) -> bool:
+        return href in self._data
+
+    def get(self, href: str) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(href)
+            if value is not None:
+                self._data.move_to_end(href)
+            return value
+
+    def put(self, href: str, value: Any) -> None:
+        with self._lock:
+            self._data[href] = value
+            self._data.move_to_end(href)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _FsspecStacIO(pystac.StacIO):
+    """
+    fsspec-backed StacIO. With a provider, reads go through its filesystems
+    and text cache; without one (the pystac default), through fsspec directly.
+    """
+
+    def __init__(self, provider: Optional["BaseProvider"] = None):
+        super().__init__()
+        self._provider = provider
+
+    def read_text(self, href: str, *args, **kwargs) -> str:
+        provider = self._provider
+        if provider is None:
+            with fsspec.open(href, "r") as f:
+                return f.read()
+        txt = provider._text_cache.get(href)
+        if txt is None:
+            txt = provider._fetch_text(href)
+            provider._text_cache.put(href, txt)
+        return txt
+
+    def json_loads(self, txt: str, *args, **kwargs) -> dict:
+        return orjson.loads(txt)
+
+    def write_text(self, href: str, txt: str, *args, **kwargs) -> None:
+        with fsspec.open(href, "w") as f:
+            f.write(txt)
+
+    def exists(self, href: str, *args, **kwargs) -> bool:
+        fs, path = fsspec.core.url_to_fs(href)
+        return fs.exists(path)
+
+
+# pystac's process-wide default StacIO is registered once, not per provider
+_default_stac_io_set = False
 
 
 class BaseProvider:
@@ -11,58 +96,200 @@ class BaseProvider:
         catalog_url: str,
         endpoint_url: str = "https://s3.gfz-potsdam.de",
         anon: bool = True,
+        prefetch: bool = False,
     ):
         self.catalog_url = catalog_url
         self.endpoint_url = endpoint_url
         self.anon = anon
-        storage_options = {
-            "anon": anon,
-            "client_kwargs": {"endpoint_url": endpoint_url},
-        }
-        self.s3_fs = fsspec.filesystem("s3", **storage_options)
+        # Path-style HTTPS prefix for objects on this endpoint (href -> s3://)
+        self._endpoint_prefix = endpoint_url.rstrip("/") + "/"
+        self._endpoint_prefix_len = len(self._endpoint_prefix)
+        # fsspec caches instances by these arguments, so providers on the same
+        # endpoint/credentials share one filesystem and its connection pool
+        self.s3_fs = fsspec.filesystem(
+            "s3",
+            anon=anon,
+            client_kwargs={"endpoint_url": endpoint_url},
+            config_kwargs=_S3_CONFIG_KWARGS,
+            default_block_size=_S3_BLOCK_SIZE,
+        )
+        # Filesystems reused per URL scheme; s3:// goes to the configured endpoint
+        self._fs_by_scheme: Dict[str, fsspec.AbstractFileSystem] = {"s3": self.s3_fs}
+        # STAC JSON text by absolute href (prefetched or already read)
+        self._text_cache = _LRU(_TEXT_CACHE_SIZE)
+        # Read the whole catalog tree concurrently when (re)loading the root
+        self.prefetch = prefetch
         self._register_stac_io()
-        self.catalog = self._load_catalog()
+        # Guards first population of the walk caches (collections_table threads)
+        self._cache_lock = threading.RLock()
+        # Root JSON is read now; the pystac Catalog is built on first access
+        self._catalog_dict: Optional[dict] = None
+        self._catalog: Optional[pystac.Catalog] = None
+        self._load_catalog()
+        # Lookups walk remote STAC JSON; memoize them until refresh()
+        self._collection_cache: Dict[str, Optional[pystac.Collection]] = {}
+        self._item_cache: Dict[Tuple[str, str], Optional[pystac.Item]] = {}
+        self._collection_index: Optional[Dict[str, pystac.Collection]] = None
 
     def _register_stac_io(self) -> None:
         """StacIO that can read both s3:// and https:// hrefs via fsspec."""
+        global _default_stac_io_set
+        # Bound to this provider and attached to its root catalog, so each
+        # provider's tree resolves through its own filesystem and caches
+        self._stac_io = _FsspecStacIO(self)
+        if not _default_stac_io_set:
+            pystac.StacIO.set_default(_FsspecStacIO)
+            _default_stac_io_set = True
 
-        class FsspecStacIO(pystac.StacIO):
-            def read_text(self, href: str, *args, **kwargs) -> str:
-                with fsspec.open(href, "r") as f:
-                    return f.read()
-
-            def write_text(self, href: str, txt: str, *args, **kwargs) -> None:
-                with fsspec.open(href, "w") as f:
-                    f.write(txt)
-
-            def exists(self, href: str, *args, **kwargs) -> bool:
-                fs, path = fsspec.core.url_to_fs(href)
-                return fs.exists(path)
+    def _fs_for(self, href: str) -> Tuple[fsspec.AbstractFileSystem, str]:
+        """Filesystem (memoized per scheme) and path for an href."""
+        scheme = href.split("://", 1)[0] if "://" in href else "file"
+        fs = self._fs_by_scheme.get(scheme)
+        if fs is None:
+            fs, _ = fsspec.core.url_to_fs(href)
+            self._fs_by_scheme[scheme] = fs
+        return fs, fs._strip_protocol(href)
 
-        pystac.StacIO.set_default(FsspecStacIO)
+    def _fetch_text(self, href: str) -> str:
+        """Read an href with a single GET (cat_file), no file object."""
+        fs, path = self._fs_for(href)
+        return fs.cat_file(path).decode("utf-8")
 
-    def _load_catalog(self) -> pystac.Catalog:
-        # fsspec.open works for s3:// and https:// (if you ever switch)
-        with fsspec.open(self.catalog_url, "r") as f:
-            catalog_dict = json.load(f)
+    def _load_catalog(self) -> None:
+        # works for s3:// (configured endpoint), https:// and local paths
+        txt = self._fetch_text(self.catalog_url)
+        self._text_cache.put(self.catalog_url, txt)
+        catalog_dict = orjson.loads(txt)
+        if self.prefetch:
+            self._prefetch_tree(self.catalog_url, catalog_dict)
 
-        cat = pystac.Catalog.from_dict(catalog_dict)
-        cat.set_self_href(self.catalog_url)
+        self._catalog_dict = catalog_dict
+        self._catalog = None
 
+    @property
+    def catalog(self) -> pystac.Catalog:
+        """Root pystac Catalog, built from the loaded root JSON on first access."""
+        cat = self._catalog
+        if cat is None:
+            with self._cache_lock:
+                cat = self._catalog
+                if cat is None:
+                    # The dict is ours alone: let pystac consume it, no deepcopy
+                    cat = pystac.Catalog.from_dict(
+                        self._catalog_dict, preserve_dict=False
+                    )
+                    cat.set_self_href(self.catalog_url)
+                    cat._stac_io = self._stac_io
+                    self._catalog = cat
+                    self._catalog_dict = None
         return cat
 
+    def _endpoint_href_to_s3(self, href: str) -> Optional[str]:
+        """
+        Map an HTTPS href served by ``endpoint_url`` (path-style
+        ``https://<endpoint>/<bucket>/<key>``) to ``s3://<bucket>/<key>``.
+        Returns None for hrefs on other hosts.
+        """
+        if href.startswith(self._endpoint_prefix):
+            return "s3://" + href[self._endpoint_prefix_len :]
+        return None
+
     # -----------------------------
     # STAC accessors
     # -----------------------------
+    def refresh(self) -> None:
+        """Reload the root catalog and drop cached collections/items."""
+        self._collection_cache.clear()
+        self._item_cache.clear()
+        self._text_cache.clear()
+        self._collection_index = None
+        self._load_catalog()
+
+    def _prefetch(self, hrefs: Iterable[str]) -> None:
+        """Read STAC JSON hrefs concurrently into the StacIO text cache."""
+        todo = [h for h in dict.fromkeys(hrefs) if h not in self._text_cache]
+        if len(todo) < 2:
+            for href in todo:
+                self._text_cache.put(href, self._fetch_text(href))
+            return
+        workers = min(_PREFETCH_WORKERS, len(todo))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for href, txt in zip(todo, pool.map(self._fetch_text, todo)):
+                self._text_cache.put(href, txt)
+
+    def _prefetch_tree(self, root_href: str, root_dict: dict) -> None:
+        """
+        Breadth-first prefetch of every child/item document under the root.
+
+        Each tree level is fetched as one concurrent batch, so pystac's later
+        walk() / get_items() calls are served from the text cache.
+        """
+        level = [(root_href, root_dict)]
+        while level:
+            child_hrefs: List[str] = []
+            item_hrefs: List[str] = []
+            for href, doc in level:
+                for link in doc.get("links", []):
+                    rel = link.get("rel")
+                    if rel in ("child", "item") and link.get("href"):
+                        target = make_absolute_href(link["href"], href)
+                        (child_hrefs if rel == "child" else item_hrefs).append(target)
+            self._prefetch(child_hrefs + item_hrefs)
+
+            level = []
+            for href in dict.fromkeys(child_hrefs):
+                txt = self._text_cache.get(href)
+                if txt is not None:
+                    level.append((href, orjson.loads(txt)))
+
+    def _prefetch_items(self, collection: pystac.Collection) -> None:
+        """Prefetch the item JSON of a collection before pystac walks it."""
+        self._prefetch(
+            link.get_absolute_href() for link in collection.get_links("item")
+        )
+
+    def _iter_item_dicts(self, collection: pystac.Collection) -> Iterator[dict]:
+        """
+        Yield the raw item JSON of a collection as plain dicts.
+
+        For callers that only read a few fields (id, properties, asset keys);
+        no pystac.Item is built, so there is no link/asset graph or deepcopy.
+        """
+        hrefs = [link.get_absolute_href() for link in collection.get_links("item")]
+        self._prefetch(hrefs)
+        for href in hrefs:
+            txt = self._text_cache.get(href)
+            if txt is None:
+                txt = self._fetch_text(href)
+            yield orjson.loads(txt)
+
     def get_collection(self, collection_id: str) -> Optional[pystac.Collection]:
-        # With themes, collections are not direct children anymore
-        return self.catalog.get_child(collection_id, recursive=True)
+        if collection_id not in self._collection_cache:
+            # One walk indexes every collection; later lookups are dict hits
+            collection = self._get_collection_index().get(collection_id)
+            if collection is None:
+                # With themes, collections are not direct children anymore
+                collection = self.catalog.get_child(collection_id, recursive=True)
+            self._collection_cache[collection_id] = collection
+        return self._collection_cache[collection_id]
+
+    def _get_item_cached(
+        self, collection_id: str, item_id: str
+    ) -> Optional[pystac.Item]:
+        """Item lookup memoized on (collection_id, item_id); None if missing."""
+        key = (collection_id, item_id)
+        if key not in self._item_cache:
+            collection = self.get_collection(collection_id)
+            self._item_cache[key] = (
+                None if collection is None else collection.get_item(item_id)
+            )
+        return self._item_cache[key]
 
     def get_item(self, collection_id: str, item_id: str) -> pystac.Item:
         collection = self.get_collection(collection_id)
         if collection is None:
             raise KeyError(f"Collection '{collection_id}' not found.")
-        item = collection.get_item(item_id)
+        item = self._get_item_cached(collection_id, item_id)
         if item is None:
             raise KeyError(
                 f"Item '{item_id}' not found in collection '{collection_id}'."
@@ -72,16 +299,28 @@ class BaseProvider:
     # -----------------------------
     # Catalog helpers
     # -----------------------------
+    def _get_collection_index(self) -> Dict[str, pystac.Collection]:
+        """{collection_id: collection} for the whole tree, kept until refresh()."""
+        if self._collection_index is None:
+            with self._cache_lock:
+                if self._collection_index is None:
+                    # Pre-order walk over child links only; items are not needed
+                    index: Dict[str, pystac.Collection] = {}
+                    stack = [self.catalog]
+                    while stack:
+                        children = list(stack.pop().get_children())
+                        for child in children:
+                            if isinstance(child, pystac.Collection):
+                                index.setdefault(child.id, child)
+                        stack.extend(reversed(children))
+                    self._collection_index = index
+        return self._collection_index
+
     def list_collections(self) -> List[pystac.Collection]:
         """
         Return all collections in the catalog, robust to themed/nested catalogs.
         """
-        cols = {}
-        for root, children, _items in self.catalog.walk():
-            for child in children:
-                if isinstance(child, pystac.Collection):
-                    cols[child.id] = child
-        return list(cols.values())
+        return list(self._get_collection_index().values())
 
     def list_collection_ids(self) -> List[str]:
         return sorted([c.id for c in self.list_collections()])
@@ -93,4 +332,5 @@ class BaseProvider:
                 f"Collection '{collection_id}' not found.\n"
                 f"Available collections: {', '.join(self.list_collection_ids())}"
             )
+        self._prefetch_items(collection)
         return list(collection.get_items())
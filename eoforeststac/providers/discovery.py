@@ -2,18 +2,97 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+import numpy as np
 import pandas as pd
 import pystac
 
 from eoforeststac.providers.base import BaseProvider
 
+# Concurrent collection reads in collections_table (network-latency bound)
+_MAX_WORKERS = 16
+# Below this many distinct versions a plain sorted() is cheaper than numpy
+_NUMPY_SORT_MIN = 64
+
+
+@lru_cache(maxsize=4096)
+def _version_key(v: str):
+    """Sort key for a version string; parsed once per distinct string."""
+    try:
+        return tuple(int(p) for p in v.split("."))
+    except ValueError:
+        return v
+
+
+def _sort_versions(versions: Iterable[str]) -> List[str]:
+    """
+    Deduplicate and sort version strings by ``_version_key``.
+
+    Long all-numeric lists are ordered with one ``np.lexsort`` over the
+    parsed parts, padded with -1 so that a shorter version sorts before its
+    extensions, as tuple comparison does ("1.0" < "1.0.0"). Anything else
+    (non-numeric or negative parts) uses ``sorted``.
+    """
+    unique = list(dict.fromkeys(versions))
+    if len(unique) < _NUMPY_SORT_MIN:
+        return sorted(unique, key=_version_key)
+
+    keys = [_version_key(v) for v in unique]
+    if not all(isinstance(k, tuple) and min(k, default=0) >= 0 for k in keys):
+        return sorted(unique, key=_version_key)
+
+    width = max(len(k) for k in keys)
+    parts = np.full((len(keys), width), -1, dtype=np.int64)
+    for row, key in enumerate(keys):
+        parts[row, : len(key)] = key
+    order = np.lexsort(parts.T[::-1])
+    return [unique[i] for i in order]
+
 
 class DiscoveryProvider(BaseProvider):
     """
     STAC-based discovery utilities for EOForestSTAC catalogs (themed).
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Theme catalogs and their collections, read once until refresh()
+        self._themes: Optional[Dict[str, pystac.Catalog]] = None
+        self._theme_collections: Dict[str, List[pystac.Collection]] = {}
+
+    def refresh(self) -> None:
+        super().refresh()
+        self._themes = None
+        self._theme_collections.clear()
+
+    def _theme_catalogs(self) -> Dict[str, pystac.Catalog]:
+        if self._themes is None:
+            with self._cache_lock:
+                if self._themes is None:
+                    themes: Dict[str, pystac.Catalog] = {}
+                    for child in self.catalog.get_children():
+                        if isinstance(child, pystac.Catalog) and not isinstance(
+                            child, pystac.Collection
+                        ):
+                            themes.setdefault(child.id, child)
+                    self._themes = themes
+        return self._themes
+
+    def _get_theme_collections(
+        self, theme_cat: pystac.Catalog
+    ) -> List[pystac.Collection]:
+        cols = self._theme_collections.get(theme_cat.id)
+        if cols is None:
+            with self._cache_lock:
+                cols = self._theme_collections.get(theme_cat.id)
+                if cols is None:
+                    cols = list(theme_cat.get_collections())
+                    self._theme_collections[theme_cat.id] = cols
+        return cols
+
     # ------------------------------------------------------------
     # Themes
     # ------------------------------------------------------------
@@ -26,22 +105,13 @@ class DiscoveryProvider(BaseProvider):
         dict
             {theme_id: theme_title}
         """
-        themes: Dict[str, str] = {}
-        for child in self.catalog.get_children():
-            if isinstance(child, pystac.Catalog) and not isinstance(
-                child, pystac.Collection
-            ):
-                themes[child.id] = child.title or child.id
-        return themes
+        return {
+            theme_id: child.title or theme_id
+            for theme_id, child in self._theme_catalogs().items()
+        }
 
     def get_theme(self, theme_id: str) -> Optional[pystac.Catalog]:
-        for child in self.catalog.get_children():
-            if isinstance(child, pystac.Catalog) and not isinstance(
-                child, pystac.Collection
-            ):
-                if child.id == theme_id:
-                    return child
-        return None
+        return self._theme_catalogs().get(theme_id)
 
     # ------------------------------------------------------------
     # Collections (require theme)
@@ -76,7 +146,7 @@ class DiscoveryProvider(BaseProvider):
             )
 
         # Note: under a theme, get_collections() is usually reliable if self_href resolves.
-        cols = list(theme_cat.get_collections())
+        cols = self._get_theme_collections(theme_cat)
         return {c.id: (c.title or c.id) for c in cols}
 
     def collections_table(self, theme: Optional[str] = None) -> pd.DataFrame:
@@ -98,9 +168,23 @@ class DiscoveryProvider(BaseProvider):
                 f"Available themes: {', '.join([f'{k} ({v})' for k, v in themes.items()])}"
             )
 
+        cols = self._get_theme_collections(theme_cat)
+        # Seed the lookup cache so list_versions does not re-walk the catalog
+        for col in cols:
+            self._collection_cache.setdefault(col.id, col)
+
+        # Each list_versions call reads every item JSON of its collection;
+        # fan the collections out so those GETs overlap instead of queueing
+        versions_list: List[List[str]] = []
+        if cols:
+            workers = min(_MAX_WORKERS, len(cols))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                versions_list = list(
+                    pool.map(self.list_versions, [col.id for col in cols])
+                )
+
         records = []
-        for col in theme_cat.get_collections():
-            versions = self.list_versions(col.id)
+        for col, versions in zip(cols, versions_list):
             records.append(
                 {
                     "collection_id": col.id,
@@ -135,29 +219,63 @@ class DiscoveryProvider(BaseProvider):
         if collection is None:
             raise KeyError(f"Collection '{collection_id}' not found.")
 
+        # Only id, version and asset keys are needed: read raw item dicts
         versions: List[str] = []
-        for item in collection.get_items():
-            version = item.properties.get("version")
+        for item in self._iter_item_dicts(collection):
+            version = (item.get("properties") or {}).get("version")
             if version is None:
-                version = self._parse_version_from_item_id(item.id, collection_id)
+                version = self._parse_version_from_item_id(
+                    item.get("id", ""), collection_id
+                )
             if version is None:
                 continue
-            if asset_key is not None and asset_key not in item.assets:
+            if asset_key is not None and asset_key not in (item.get("assets") or {}):
                 continue
             versions.append(version)
 
-        return sorted(set(versions), key=self._version_key)
+        return _sort_versions(versions)
+
+    def list_versions_fast(
+        self, collection_id: str, asset_key: Optional[str] = None
+    ) -> List[str]:
+        """
+        List versions from a single directory listing of the collection.
+
+        Item documents are laid out as ``<collection dir>/<item id>/<item id>.json``
+        with ids ``{collection_id}_v{version}``, so one LIST replaces one GET
+        per item. Versions are inferred from item ids only (``properties.version``
+        is not read). Falls back to :meth:`list_versions` when ``asset_key`` is
+        given or the collection location cannot be listed (non-endpoint HTTP).
+        """
+        collection = self.get_collection(collection_id)
+        if collection is None:
+            raise KeyError(f"Collection '{collection_id}' not found.")
+
+        self_href = collection.get_self_href()
+        if asset_key is not None or not self_href:
+            return self.list_versions(collection_id, asset_key=asset_key)
+
+        prefix = self_href.rsplit("/", 1)[0]
+        if prefix.startswith(("http://", "https://")):
+            prefix = self._endpoint_href_to_s3(prefix)
+            if prefix is None:
+                return self.list_versions(collection_id)
+
+        fs, path = self._fs_for(prefix)
+        pattern = re.compile(rf"{re.escape(collection_id)}_v(.+?)(?:\.json)?")
+        versions = set()
+        for key in fs.ls(path, detail=False):
+            m = pattern.fullmatch(key.rstrip("/").rsplit("/", 1)[-1])
+            if m:
+                versions.add(m.group(1))
+
+        return _sort_versions(versions)
 
     @staticmethod
     def _parse_version_from_item_id(item_id: str, collection_id: str) -> Optional[str]:
         prefix = f"{collection_id}_v"
         if item_id.startswith(prefix):
-            return item_id[len(prefix) :]
+            return item_id.removeprefix(prefix)
         return None
 
-    @staticmethod
-    def _version_key(v: str):
-        try:
-            return tuple(int(p) for p in v.split("."))
-        except ValueError:
-            return v
+    _version_key = staticmethod(_version_key)
@@ -16,14 +16,19 @@ Design principles
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Tuple
 import warnings
 
 import xarray as xr
 
+from eoforeststac.core._crs import crs_to_string
+
 try:
     import geopandas as gpd
+    from pyproj import CRS, Transformer
     from shapely.geometry.base import BaseGeometry
+    from shapely.ops import transform as shapely_transform
 except ImportError:  # optional dependency
     gpd = None
     BaseGeometry = None
@@ -56,7 +61,7 @@ def infer_dataset_crs(ds: xr.Dataset) -> str:
         try:
             crs = ds.rio.crs
             if crs is not None:
-                return crs.to_string()
+                return crs_to_string(ds, crs)
         except Exception:
             pass
 
@@ -79,6 +84,23 @@ def infer_dataset_crs(ds: xr.Dataset) -> str:
     )
 
 
+@lru_cache(maxsize=64)
+def _is_wgs84(crs: str) -> bool:
+    return CRS.from_user_input(crs) == CRS.from_epsg(4326)
+
+
+@lru_cache(maxsize=64)
+def _transformer_from_wgs84(crs: str) -> "Transformer":
+    return Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+
+
+def _geometry_to_crs(geom, crs: str):
+    """Reproject an EPSG:4326 geometry to ``crs`` (identity for EPSG:4326)."""
+    if _is_wgs84(crs):
+        return geom
+    return shapely_transform(_transformer_from_wgs84(crs).transform, geom)
+
+
 # ---------------------------------------------------------------------
 # Coordinate utilities
 # ---------------------------------------------------------------------
@@ -135,6 +157,21 @@ def subset_bbox(
     minx, miny, maxx, maxy = bbox
     lon_name, lat_name = _get_xy_names(ds, lon, lat)
 
+    indexes = ds.indexes
+    if lon_name in indexes and lat_name in indexes:
+        # Resolve labels to positions on the in-memory pandas indexes (what
+        # .sel does internally) and slice with .isel; the orientation check
+        # reads the index, never the (possibly lazy) coordinate variable
+        lon_index = indexes[lon_name]
+        lat_index = indexes[lat_name]
+        lat_slice = _latitude_slice(lat_index, miny, maxy)
+        return ds.isel(
+            {
+                lon_name: lon_index.slice_indexer(minx, maxx),
+                lat_name: lat_index.slice_indexer(lat_slice.start, lat_slice.stop),
+            }
+        )
+
     lat_slice = _latitude_slice(ds[lat_name], miny, maxy)
 
     return ds.sel(
@@ -180,7 +217,7 @@ def subset_geometry(
     ds_crs = infer_dataset_crs(ds)
 
     # Reproject geometry (INPUT IS ALWAYS EPSG:4326)
-    geom_proj = gpd.GeoSeries([geom], crs="EPSG:4326").to_crs(ds_crs).iloc[0]
+    geom_proj = _geometry_to_crs(geom, ds_crs)
 
     # Bounding-box subset (cheap, lazy)
     ds = subset_bbox(ds, geom_proj.bounds, lon=lon, lat=lat)
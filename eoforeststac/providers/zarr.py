@@ -1,10 +1,18 @@
 # eoforeststac/providers/zarr.py
 
+import warnings
+
 import fsspec
 import xarray as xr
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple
+
+from eoforeststac.providers.base import BaseProvider, _LRU
+from eoforeststac.providers.subset import subset_bbox
 
-from eoforeststac.providers.base import BaseProvider
+# Lazy non-index coordinates up to this size are loaded right after opening
+_COORD_PREFETCH_MAX_BYTES = 64 * 2**20
+# Opened (lazy) datasets kept per provider; each holds metadata and coords only
+_DATASET_CACHE_SIZE = 16
 
 
 class ZarrProvider(BaseProvider):
@@ -12,6 +20,85 @@ class ZarrProvider(BaseProvider):
     Generic STAC-driven Zarr provider.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Whether a store href has consolidated metadata (.zmetadata)
+        self._consolidated: Dict[str, bool] = {}
+        # Lazily opened datasets by store href: metadata and index coords are
+        # read once, later opens return a shallow copy without touching S3
+        self._datasets = _LRU(_DATASET_CACHE_SIZE)
+
+    def refresh(self) -> None:
+        super().refresh()
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Drop the opened datasets and consolidated-metadata probes, so the
+        next open_dataset() re-reads store metadata (e.g. after a rewrite).
+        """
+        self._consolidated.clear()
+        self._datasets.clear()
+
+    def _is_consolidated(self, href: str, store) -> bool:
+        """Probe .zmetadata once per href instead of failing an open first."""
+        consolidated = self._consolidated.get(href)
+        if consolidated is None:
+            consolidated = ".zmetadata" in store
+            self._consolidated[href] = consolidated
+            if not consolidated:
+                # Readers cannot repair this (anonymous, read-only); the store's
+                # writer should run zarr.consolidate_metadata() once
+                warnings.warn(
+                    f"Zarr store '{href}' has no consolidated metadata (.zmetadata); "
+                    "opening it lists and reads every array's metadata separately, "
+                    "which is much slower. Run zarr.consolidate_metadata() on the "
+                    "store to fix this.",
+                    UserWarning,
+                )
+        return consolidated
+
+    def _get_store(self, href: str):
+        s3_path = self._endpoint_href_to_s3(href)
+        if s3_path is not None:
+            # Objects on our own endpoint: go through the S3 API (s3fs), not plain HTTP
+            return self.s3_fs.get_mapper(s3_path)
+        if href.startswith("https://"):
+            return fsspec.get_mapper(href)
+        return self.s3_fs.get_mapper(href)
+
+    def _open_zarr_cached(self, href: str) -> xr.Dataset:
+        """Open the Zarr store at ``href`` once; return a shallow copy each time."""
+        ds = self._datasets.get(href)
+        if ds is None:
+            store = self._get_store(href)
+            ds = xr.open_zarr(
+                store=store, consolidated=self._is_consolidated(href, store)
+            )
+            ds = self._load_coords(ds)
+            self._datasets.put(href, ds)
+        return ds.copy()
+
+    @staticmethod
+    def _load_coords(ds: xr.Dataset) -> xr.Dataset:
+        """
+        Load small lazy coordinates (auxiliary / non-index) in one dask
+        compute, so their chunks are fetched concurrently instead of one
+        round trip per coordinate whenever they are first touched.
+        Index coordinates are already in memory after open_zarr.
+        """
+        names = [
+            name
+            for name, coord in ds.coords.items()
+            if name not in ds.indexes
+            and coord.chunks is not None
+            and coord.nbytes <= _COORD_PREFETCH_MAX_BYTES
+        ]
+        if not names:
+            return ds
+        loaded = xr.Dataset({name: ds[name].variable for name in names}).load()
+        return ds.assign_coords({name: loaded[name].variable for name in names})
+
     def open_dataset(
         self,
         collection_id: str,
@@ -19,7 +106,15 @@ class ZarrProvider(BaseProvider):
         asset_key: str = "zarr",
         resolution: Optional[str] = None,
         variables: Optional[Sequence[str]] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
     ) -> xr.Dataset:
+        """
+        Open a product version as a lazy (dask-backed) Dataset.
+
+        If ``bbox`` (minx, miny, maxx, maxy in the dataset CRS) is given, the
+        dataset is cropped right after opening so only the Zarr chunks that
+        intersect the window are ever fetched.
+        """
 
         # ----------------------------------------------------------
         # 0. Collection existence check
@@ -38,16 +133,18 @@ class ZarrProvider(BaseProvider):
         # ----------------------------------------------------------
         item_id = f"{collection_id}_v{version}"
 
-        item = collection.get_item(item_id)
+        item = self._get_item_cached(collection_id, item_id)
 
         # ----------------------------------------------------------
         # 2. Version existence check
         # ----------------------------------------------------------
         if item is None:
+            # Error path only: read raw item dicts (prefetched) to list versions
+            prefix = f"{collection_id}_v"
             versions = sorted(
-                i.id.replace(f"{collection_id}_v", "")
-                for i in collection.get_items()
-                if i.id.startswith(f"{collection_id}_v")
+                d["id"].removeprefix(prefix)
+                for d in self._iter_item_dicts(collection)
+                if d.get("id", "").startswith(prefix)
             )
 
             if versions:
@@ -83,20 +180,16 @@ class ZarrProvider(BaseProvider):
             )
 
         href = item.assets[asset_key].href
-        if href.startswith("https://"):
-            store = fsspec.get_mapper(href)
-        else:
-            store = self.s3_fs.get_mapper(href)
 
         # ----------------------------------------------------------
         # 4. Open Zarr
         # ----------------------------------------------------------
-        try:
-            ds = xr.open_zarr(store=store, consolidated=True)
-        except (KeyError, FileNotFoundError):
-            ds = xr.open_zarr(store=store, consolidated=False)
+        ds = self._open_zarr_cached(href)
 
         if variables is not None:
             ds = ds[variables]
 
+        if bbox is not None:
+            ds = subset_bbox(ds, bbox)
+
         return ds
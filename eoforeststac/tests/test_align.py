@@ -0,0 +1,241 @@
+"""Tests for DatasetAligner.
+
+Dask-backed inputs are reprojected lazily, one output chunk per task from a
+bounded source window; the results must match the eager (in-memory) warp.
+"""
+
+import dask
+import numpy as np
+import pytest
+import rioxarray  # noqa: F401
+import xarray as xr
+from pyproj import Transformer
+
+from eoforeststac.providers import align
+from eoforeststac.providers.align import DatasetAligner
+
+# ------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def ref():
+    """Target grid: 60 x 60 pixels of 0.05 deg (EPSG:4326)."""
+    lon = 5.025 + np.arange(60) * 0.05
+    lat = 49.975 - np.arange(60) * 0.05
+    return xr.Dataset(
+        {"r": (("latitude", "longitude"), np.zeros((60, 60), "float32"))},
+        coords={"longitude": lon, "latitude": lat},
+    ).rio.write_crs("EPSG:4326")
+
+
+@pytest.fixture(scope="module")
+def src():
+    """Web Mercator source covering the target grid, with a time dim."""
+    rng = np.random.default_rng(1)
+    to_merc = Transformer.from_crs(4326, 3857, always_xy=True)
+    (x0, y0), (x1, y1) = to_merc.transform(4.9, 47.9), to_merc.transform(8.1, 50.1)
+    n = 200
+    ds = xr.Dataset(
+        {
+            "f": (("time", "y", "x"), rng.random((2, n, n)).astype("float32")),
+            "i": (("y", "x"), rng.integers(0, 5, (n, n)).astype("int16")),
+        },
+        coords={"x": np.linspace(x0, x1, n), "y": np.linspace(y1, y0, n), "time": [0, 1]},
+    ).rio.write_crs("EPSG:3857")
+    ds["i"] = ds["i"].rio.write_nodata(-1)
+    return ds
+
+
+def _align(ref, src, method, **kwargs):
+    aligner = DatasetAligner(target="ref", resampling={"src": {"default": method}}, **kwargs)
+    return aligner.align({"ref": ref, "src": src})
+
+
+# ------------------------------------------------------------------
+# Lazy (windowed) reprojection
+# ------------------------------------------------------------------
+
+
+class TestLazyReprojection:
+    @pytest.mark.parametrize("method", ["nearest", "mode"])
+    def test_matches_eager_exactly(self, ref, src, method):
+        eager = _align(ref, src, method)
+        lazy = _align(
+            ref, src.chunk({"x": 50, "y": 50, "time": 1}), method, reproject_chunks=(16, 16)
+        )
+        for var in ("f", "i"):
+            assert lazy[var].chunks is not None
+            assert lazy[var].dtype == eager[var].dtype
+            np.testing.assert_array_equal(lazy[var].values, eager[var].values)
+
+    @pytest.mark.parametrize("method", ["bilinear", "cubic"])
+    def test_kernel_methods_close_to_eager(self, ref, src, method):
+        eager = _align(ref, src, method)
+        lazy = _align(
+            ref, src.chunk({"x": 50, "y": 50, "time": 1}), method, reproject_chunks=(16, 16)
+        )
+        # GDAL sizes the kernel from each chunk's window, so values differ slightly
+        np.testing.assert_allclose(lazy["f"].values, eager["f"].values, atol=5e-3)
+
+    def test_tasks_read_bounded_source_windows(self, ref, src):
+        chunked = src.chunk({"x": 50, "y": 50, "time": 1})
+        lazy = _align(ref, chunked, "nearest", reproject_chunks=(16, 16))
+
+        graph = lazy["f"].data.__dask_graph__()
+        layers = [name for name in graph.layers if name.startswith("reproject")]
+        assert len(layers) == 1
+
+        deps = [
+            len(dask.core.get_dependencies(dict(graph), key=key))
+            for key in graph.layers[layers[0]].keys()
+        ]
+        assert max(deps) < chunked["f"].data.npartitions
+
+
+# ------------------------------------------------------------------
+# Merge
+# ------------------------------------------------------------------
+
+
+class TestMerge:
+    def test_time_axes_may_differ(self, ref, src):
+        ref_t = ref.expand_dims(time=[5])
+        out = DatasetAligner(target="ref").align({"ref": ref_t, "src": src})
+        assert list(out["time"].values) == [0, 1, 5]
+        assert out.sizes["latitude"] == 60 and out.sizes["longitude"] == 60
+
+    def test_output_on_target_grid(self, ref, src):
+        out = _align(ref, src, "nearest")
+        np.testing.assert_allclose(out["longitude"].values, ref["longitude"].values)
+        np.testing.assert_allclose(out["latitude"].values, ref["latitude"].values)
+        assert out.rio.crs.to_epsg() == 4326
+
+
+# ------------------------------------------------------------------
+# Coarsening
+# ------------------------------------------------------------------
+
+
+def _mode_reference(values: np.ndarray, factor: int) -> np.ndarray:
+    """Per-window mode (smallest value wins ties) with np.unique."""
+    ny, nx = values.shape[0] // factor, values.shape[1] // factor
+    out = np.empty((ny, nx), values.dtype)
+    for i in range(ny):
+        for j in range(nx):
+            window = values[i * factor : (i + 1) * factor, j * factor : (j + 1) * factor]
+            uniq, counts = np.unique(window, return_counts=True)
+            out[i, j] = uniq[np.argmax(counts)]
+    return out
+
+
+class TestCoarsenMode:
+    @pytest.fixture
+    def wide(self):
+        """int16 raster spanning -9999..10000, with repeated values per window."""
+        rng = np.random.default_rng(2)
+        values = rng.integers(-9999, 10001, (32, 32)).astype("int16")
+        values[::2, ::2] = values[1::2, 1::2]
+        return xr.Dataset(
+            {"c": (("y", "x"), values)},
+            coords={"x": np.arange(32) + 0.5, "y": 32 - np.arange(32) - 0.5},
+        ).rio.write_crs("EPSG:3035")
+
+    @pytest.mark.parametrize("max_counts", [1 << 24, 1])
+    def test_wide_integer_range(self, wide, monkeypatch, max_counts):
+        # max_counts=1 forces the sort path for every window
+        monkeypatch.setattr(align, "_MODE_BINCOUNT_MAX_COUNTS", max_counts)
+        out = align._coarsen_dataset(wide, x_dim="x", y_dim="y", factor=2, agg="mode")
+        assert out["c"].dtype == np.int16
+        np.testing.assert_array_equal(out["c"].values, _mode_reference(wide["c"].values, 2))
+
+    def test_dask_blocks(self, wide):
+        out = align._coarsen_dataset(
+            wide.chunk({"x": 16, "y": 16}), x_dim="x", y_dim="y", factor=2, agg="mode"
+        )
+        np.testing.assert_array_equal(out["c"].values, _mode_reference(wide["c"].values, 2))
+
+    def test_many_windows_wide_range_stays_bounded(self):
+        # 2**18 windows x 20001 values would need ~40 GiB of bincount counts
+        rng = np.random.default_rng(3)
+        values = rng.integers(-9999, 10001, (1024, 1024)).astype("int16")
+        windows = values.reshape(512, 2, 512, 2)
+        out = align._mode_np(windows, axis=(1, 3))
+        expected = align._mode_np(windows.astype("float64"), axis=(1, 3))
+        np.testing.assert_array_equal(out, expected.astype("int16"))
+
+
+# ------------------------------------------------------------------
+# WarpedVRT reads
+# ------------------------------------------------------------------
+
+
+class TestWarpedVRT:
+    @pytest.fixture(scope="class")
+    def tif(self, tmp_path_factory, src):
+        """Single-band GeoTIFF (the source grid) with a nodata block."""
+        values = src["f"].isel(time=0).values.copy()
+        values[:40, :60] = -9999
+        path = tmp_path_factory.mktemp("vrt") / "src.tif"
+        da = src["f"].isel(time=0, drop=True).copy(data=values)
+        da.rio.write_nodata(-9999).rio.to_raster(path)
+        return path
+
+    @pytest.fixture
+    def vrt_used(self, monkeypatch):
+        """Records whether each _open_warped call read through a WarpedVRT."""
+        used = []
+        open_warped = align._open_warped
+
+        def spy(*args, **kwargs):
+            out = open_warped(*args, **kwargs)
+            used.append(out is not None)
+            return out
+
+        monkeypatch.setattr(align, "_open_warped", spy)
+        return used
+
+    def _compare(self, ref, da):
+        ds = da.to_dataset(name="v")
+        eager = _align(ref, ds, "nearest", use_warped_vrt=False)
+        warped = _align(ref, ds, "nearest", use_warped_vrt=True)
+        assert warped["v"].dtype == eager["v"].dtype
+        np.testing.assert_array_equal(
+            np.isnan(warped["v"].values), np.isnan(eager["v"].values)
+        )
+        np.testing.assert_allclose(warped["v"].values, eager["v"].values)
+        return eager["v"].values
+
+    @pytest.mark.parametrize("chunks", [None, {"x": 64, "y": 64}])
+    def test_masked_matches_eager(self, ref, tif, vrt_used, chunks):
+        da = rioxarray.open_rasterio(tif, masked=True, chunks=chunks).sel(band=1)
+        values = self._compare(ref, da)
+        assert vrt_used == [True]
+        assert np.isnan(values).any()
+
+    def test_unmasked_keeps_nodata_values(self, ref, tif, vrt_used):
+        da = rioxarray.open_rasterio(tif).sel(band=1)
+        values = self._compare(ref, da)
+        assert vrt_used == [True]
+        assert not np.isnan(values).any()
+        assert (values == -9999).any()
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda da: da.isel(x=slice(0, 100)),
+            lambda da: da.where(da < 0.5),
+            lambda da: da.astype("float64"),
+            lambda da: da.chunk({"x": 64, "y": 64}).where(da < 0.5),
+        ],
+        ids=["isel", "where", "astype", "dask-where"],
+    )
+    def test_in_memory_changes_are_kept(self, ref, tif, vrt_used, change):
+        da = rioxarray.open_rasterio(tif, masked=True).sel(band=1)
+        changed = change(da)
+        # depending on the xarray version these ops keep or drop the encoding;
+        # keep it, so the file source still looks available
+        changed.encoding = dict(da.encoding)
+        self._compare(ref, changed)
+        assert vrt_used == [False]
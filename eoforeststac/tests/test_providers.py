@@ -0,0 +1,108 @@
+"""Tests for the STAC providers against a small catalog on local disk."""
+
+import datetime
+
+import pystac
+import pytest
+
+from eoforeststac.providers.discovery import DiscoveryProvider
+
+VERSIONS = ["1.0", "1.10", "2.0"]
+
+# ------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def catalog_url(tmp_path_factory):
+    """Self-contained catalog: two themes, two collections each, three versions."""
+    root_dir = tmp_path_factory.mktemp("catalog")
+    when = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    extent = pystac.Extent(
+        pystac.SpatialExtent([[-180, -90, 180, 90]]),
+        pystac.TemporalExtent([[when, None]]),
+    )
+
+    root = pystac.Catalog("root", "Test catalog")
+    for theme_id in ("biomass", "disturbance"):
+        theme = pystac.Catalog(theme_id, f"{theme_id} theme", title=theme_id.title())
+        root.add_child(theme)
+        for n in range(2):
+            cid = f"{theme_id}_c{n}"
+            collection = pystac.Collection(cid, f"Collection {cid}", extent, title=cid)
+            theme.add_child(collection)
+            for version in VERSIONS:
+                item = pystac.Item(
+                    f"{cid}_v{version}",
+                    {"type": "Point", "coordinates": [0, 0]},
+                    [0, 0, 0, 0],
+                    when,
+                    {},
+                )
+                item.add_asset("zarr", pystac.Asset(f"s3://bucket/{cid}_v{version}.zarr"))
+                collection.add_item(item)
+
+    root.normalize_hrefs(str(root_dir))
+    root.save(pystac.CatalogType.SELF_CONTAINED)
+    return str(root_dir / "catalog.json")
+
+
+def _block_reads(provider, monkeypatch):
+    """Fail any further read that is not served from the provider's text cache."""
+
+    def fail(href):
+        raise AssertionError(f"unexpected read of {href}")
+
+    monkeypatch.setattr(provider, "_fetch_text", fail)
+
+
+# ------------------------------------------------------------------
+# Prefetch
+# ------------------------------------------------------------------
+
+
+class TestPrefetch:
+    def test_prefetch_serves_tree_from_cache(self, catalog_url, monkeypatch):
+        provider = DiscoveryProvider(catalog_url, prefetch=True)
+        _block_reads(provider, monkeypatch)
+
+        assert provider.list_collection_ids() == [
+            "biomass_c0",
+            "biomass_c1",
+            "disturbance_c0",
+            "disturbance_c1",
+        ]
+        item = provider.get_item("biomass_c1", "biomass_c1_v2.0")
+        assert item.assets["zarr"].href == "s3://bucket/biomass_c1_v2.0.zarr"
+
+    def test_refresh_rereads_catalog(self, catalog_url):
+        provider = DiscoveryProvider(catalog_url, prefetch=True)
+        provider.refresh()
+        assert provider.list_themes() == {"biomass": "Biomass", "disturbance": "Disturbance"}
+
+
+# ------------------------------------------------------------------
+# Versions
+# ------------------------------------------------------------------
+
+
+class TestVersions:
+    @pytest.fixture(scope="class")
+    def provider(self, catalog_url):
+        return DiscoveryProvider(catalog_url)
+
+    def test_list_versions_sorted_numerically(self, provider):
+        assert provider.list_versions("disturbance_c0") == VERSIONS
+
+    def test_list_versions_fast_matches_list_versions(self, provider):
+        for cid in provider.list_collection_ids():
+            assert provider.list_versions_fast(cid) == provider.list_versions(cid)
+
+    def test_list_versions_fast_with_asset_key(self, provider):
+        assert provider.list_versions_fast("biomass_c0", asset_key="zarr") == VERSIONS
+        assert provider.list_versions_fast("biomass_c0", asset_key="cog") == []
+
+    def test_unknown_collection_raises(self, provider):
+        with pytest.raises(KeyError):
+            provider.list_versions_fast("missing")
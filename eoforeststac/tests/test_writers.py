@@ -0,0 +1,299 @@
+"""Round-trip tests for the Zarr writers.
+
+Writers are pointed at a local directory (instead of Ceph/S3) and the
+written store is read back and compared with the values computed from the
+synthetic inputs.
+"""
+
+import os
+
+import numpy as np
+import pytest
+import rasterio.shutil
+import rioxarray  # noqa: F401
+import xarray as xr
+from packaging.version import Version
+
+from eoforeststac.writers.base import GDAL_READ_DEFAULTS, BaseZarrWriter, configure_gdal
+from eoforeststac.writers.CCI_biomass import CCIBiomassWriter
+from eoforeststac.writers.efda import EFDAWriter
+
+YEARS = [2018, 2019, 2020]
+FILL = -9999
+
+# ------------------------------------------------------------------
+# Local writers (module level, so the process-pool path can pickle them)
+# ------------------------------------------------------------------
+
+
+class _LocalEFDAWriter(EFDAWriter):
+    """EFDAWriter storing to a local path; no S3 filesystem is created."""
+
+    def __init__(self):
+        pass
+
+    def make_store(self, zarr_path: str):
+        return zarr_path
+
+
+class _LocalCCIBiomassWriter(CCIBiomassWriter):
+    """CCIBiomassWriter storing to a local path; no S3 filesystem is created."""
+
+    def __init__(self):
+        pass
+
+    def make_store(self, zarr_path: str):
+        return zarr_path
+
+
+# ------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def local_zarr():
+    """
+    Skip on the one known incompatible pair: xarray 2026+ passes
+    ``zarr_format`` to ``open_group``, which zarr-python 2 does not accept.
+    """
+    zarr = pytest.importorskip("zarr")
+    if Version(zarr.__version__).major < 3 and Version(xr.__version__).major >= 2026:
+        pytest.skip(f"xarray {xr.__version__} cannot write with zarr {zarr.__version__}")
+
+
+def _raster(values: np.ndarray, crs: str, nodata=None) -> xr.DataArray:
+    """(band=1, y, x) raster on a 30 m grid (EPSG:3035) or 0.01 deg grid (EPSG:4326)."""
+    ny, nx = values.shape
+    if crs == "EPSG:3035":
+        x0, y0, res = 4_000_000.0, 3_000_000.0, 30.0
+    else:
+        x0, y0, res = 10.0, 50.0, 0.01
+    da = xr.DataArray(
+        values[np.newaxis],
+        dims=("band", "y", "x"),
+        coords={
+            "band": [1],
+            "y": y0 - (np.arange(ny) + 0.5) * res,
+            "x": x0 + (np.arange(nx) + 0.5) * res,
+        },
+    ).rio.write_crs(crs)
+    if nodata is not None:
+        da = da.rio.write_nodata(nodata)
+    return da
+
+
+@pytest.fixture(scope="module")
+def efda_inputs(tmp_path_factory):
+    """Yearly mosaic/agent GeoTIFFs, a forest mask, and the expected output."""
+    root = tmp_path_factory.mktemp("efda")
+    rng = np.random.default_rng(0)
+    shape = (40, 50)
+
+    mask = rng.choice([0, 1, 2], size=shape).astype("float32")
+    mask[:5] = -1  # outside the mask's domain (nodata)
+    _raster(mask, "EPSG:3035", nodata=-1).rio.to_raster(root / "mask.tif")
+
+    expected = {"disturbance_occurrence": [], "disturbance_agent": []}
+    for year in YEARS:
+        mosaic = rng.integers(0, 2, size=shape).astype("int16")
+        agent = (mosaic * rng.integers(1, 4, size=shape)).astype("int16")
+        _raster(mosaic, "EPSG:3035").rio.to_raster(root / f"{year}_mosaic.tif")
+        _raster(agent, "EPSG:3035").rio.to_raster(root / f"{year}_agent.tif")
+        expected["disturbance_occurrence"].append(np.where(mask == 1, mosaic, FILL))
+        expected["disturbance_agent"].append(np.where(mask == 1, agent, FILL))
+
+    return root, {k: np.stack(v) for k, v in expected.items()}
+
+
+# ------------------------------------------------------------------
+# Fill / cast helpers
+# ------------------------------------------------------------------
+
+
+class TestFillHelpers:
+    @pytest.fixture
+    def ds(self):
+        return xr.Dataset(
+            {
+                "f": ("x", np.array([1.5, np.nan, np.inf, 0.0, -2.0], "float32")),
+                "i": ("x", np.array([1, 0, 3, 0, 5], "int16")),
+            }
+        ).chunk({"x": 2})
+
+    def test_apply_fillvalue_replaces_non_finite(self, ds):
+        out = BaseZarrWriter.apply_fillvalue(ds, fill_value=FILL)
+        np.testing.assert_array_equal(out["f"].values, [1.5, FILL, FILL, 0.0, -2.0])
+        assert out["f"].dtype == np.float32
+        assert out["f"].chunks == ds["f"].chunks
+
+    def test_apply_fillvalue_leaves_integers_untouched(self, ds):
+        out = BaseZarrWriter.apply_fillvalue(ds, fill_value=FILL)
+        np.testing.assert_array_equal(out["i"].values, ds["i"].values)
+        assert out["i"].dtype == np.int16
+
+    def test_fill_and_cast_matches_where_astype(self, ds):
+        out = BaseZarrWriter.fill_and_cast(ds, fill_value=FILL, dtype="int32")
+        ref = ds.where(np.isfinite(ds), FILL).astype("int32")
+        for var in ds.data_vars:
+            assert out[var].dtype == np.int32
+            np.testing.assert_array_equal(out[var].values, ref[var].values)
+
+    def test_fill_and_cast_zero_is_nodata(self, ds):
+        out = BaseZarrWriter.fill_and_cast(
+            ds, fill_value=FILL, dtype="int32", zero_is_nodata=True
+        )
+        np.testing.assert_array_equal(out["f"].values, [1, FILL, FILL, FILL, -2])
+        np.testing.assert_array_equal(out["i"].values, [1, FILL, 3, FILL, 5])
+
+    def test_fill_and_cast_keeps_attrs(self, ds):
+        ds["f"].attrs["units"] = "Mg/ha"
+        out = BaseZarrWriter.fill_and_cast(ds, fill_value=FILL)
+        assert out["f"].attrs["units"] == "Mg/ha"
+
+
+# ------------------------------------------------------------------
+# GDAL settings
+# ------------------------------------------------------------------
+
+
+class TestConfigureGdal:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        # setenv first so monkeypatch restores (or removes) each variable afterwards
+        for name in GDAL_READ_DEFAULTS:
+            monkeypatch.setenv(name, "")
+            monkeypatch.delenv(name)
+
+    def test_writer_leaves_environment_alone(self):
+        BaseZarrWriter(endpoint_url="http://localhost:9000", bucket="b", anon=True)
+        assert not any(name in os.environ for name in GDAL_READ_DEFAULTS)
+
+    def test_sets_defaults_and_overrides(self):
+        configure_gdal(GDAL_CACHEMAX="512")
+        assert os.environ["GDAL_CACHEMAX"] == "512"
+        assert os.environ["VSI_CACHE"] == GDAL_READ_DEFAULTS["VSI_CACHE"]
+
+    def test_existing_values_win(self, monkeypatch):
+        monkeypatch.setenv("GDAL_HTTP_VERSION", "1.1")
+        configure_gdal()
+        assert os.environ["GDAL_HTTP_VERSION"] == "1.1"
+
+
+# ------------------------------------------------------------------
+# EFDA region writes
+# ------------------------------------------------------------------
+
+
+class TestEFDAWrite:
+    @pytest.mark.parametrize("processes", [None, 2])
+    def test_round_trip(self, local_zarr, efda_inputs, tmp_path, processes):
+        root, expected = efda_inputs
+        out = tmp_path / "efda.zarr"
+
+        _LocalEFDAWriter().write(
+            str(root),
+            str(root),
+            YEARS,
+            str(out),
+            mosaic_pattern="{year}_mosaic.tif",
+            agent_pattern="{year}_agent.tif",
+            forest_mask_path=str(root / "mask.tif"),
+            chunks={"y": 20, "x": 25},
+            batch_years=2,
+            processes=processes,
+        )
+
+        ds = xr.open_zarr(out, mask_and_scale=False)
+        np.testing.assert_array_equal(
+            ds["time"].values, [np.datetime64(f"{y}-01-01") for y in YEARS]
+        )
+        for var, values in expected.items():
+            assert ds[var].dtype == np.int16
+            assert ds[var].encoding["chunks"] == (1, 20, 25)
+            np.testing.assert_array_equal(ds[var].values, values)
+
+    def test_fill_value_masks_on_read(self, local_zarr, efda_inputs, tmp_path):
+        root, expected = efda_inputs
+        out = tmp_path / "efda.zarr"
+
+        _LocalEFDAWriter().write(
+            str(root),
+            str(root),
+            YEARS[:1],
+            str(out),
+            mosaic_pattern="{year}_mosaic.tif",
+            agent_pattern="{year}_agent.tif",
+            forest_mask_path=str(root / "mask.tif"),
+            chunks={"y": 20, "x": 25},
+        )
+
+        occurrence = xr.open_zarr(out)["disturbance_occurrence"].values
+        np.testing.assert_array_equal(
+            np.isnan(occurrence), expected["disturbance_occurrence"][:1] == FILL
+        )
+
+
+# ------------------------------------------------------------------
+# CCI biomass int16 packing
+# ------------------------------------------------------------------
+
+
+class TestCCIPacking:
+    @pytest.fixture
+    def vrt_dir(self, tmp_path):
+        rng = np.random.default_rng(1)
+        agb = rng.integers(0, 500, size=(30, 40)).astype("float32")
+        std = rng.integers(0, 300, size=(30, 40)).astype("float32")
+        std[0, :4] = [40000, 70000, -40000, 32767]  # outside / at the int16 edge
+        agb[-3:] = std[-3:] = 65535  # no tile coverage (VRT nodata)
+
+        for prefix, values in (("AGB", agb), ("AGB_SD", std)):
+            tif = tmp_path / f"{prefix}_2020.tif"
+            _raster(values, "EPSG:4326", nodata=65535).rio.to_raster(tif)
+            rasterio.shutil.copy(tif, tmp_path / f"{prefix}_2020.vrt", driver="VRT")
+        return tmp_path, agb, std
+
+    def test_clip_to_encoding_excludes_fill(self):
+        da = xr.DataArray(
+            np.array([-40000.0, -32768.0, 0.0, 40000.0, np.nan]),
+            name="aboveground_biomass_std",
+        )
+        out = _LocalCCIBiomassWriter()._clip_to_encoding(da)
+        np.testing.assert_array_equal(
+            out.values, [-32767.0, -32767.0, 0.0, 32767.0, np.nan]
+        )
+
+    @pytest.mark.parametrize("chunks", [None, {"x": 2}])
+    def test_require_whole_rejects_fractions(self, chunks):
+        da = xr.DataArray(
+            np.array([0.0, 12.0, np.nan, 7.5]), dims="x", name="aboveground_biomass_std"
+        )
+        if chunks is not None:
+            da = da.chunk(chunks)
+        out = CCIBiomassWriter._require_whole(da.isel(x=slice(0, 3)))
+        np.testing.assert_array_equal(out.values, [0.0, 12.0, np.nan])
+        with pytest.raises(ValueError, match="non-integer"):
+            CCIBiomassWriter._require_whole(da).values
+
+    def test_round_trip(self, local_zarr, vrt_dir, tmp_path):
+        src, agb, std = vrt_dir
+        out = tmp_path / "cci.zarr"
+
+        _LocalCCIBiomassWriter().write(
+            str(src), str(out), chunks={"latitude": 16, "longitude": 16}
+        )
+
+        raw = xr.open_zarr(out, mask_and_scale=False)
+        assert raw["aboveground_biomass_std"].dtype == np.int16
+        assert raw["aboveground_biomass"].dtype == np.int32
+
+        nodata = std == 65535
+        expected_std = np.clip(std, -32767, 32767)
+        decoded = xr.open_zarr(out)["aboveground_biomass_std"].values[0]
+        np.testing.assert_array_equal(np.isnan(decoded), nodata)
+        np.testing.assert_array_equal(decoded[~nodata], expected_std[~nodata])
+
+        np.testing.assert_array_equal(
+            raw["aboveground_biomass"].values[0], np.where(nodata, FILL, agb)
+        )
@@ -60,6 +60,13 @@ class CCIBiomassWriter(BaseZarrWriter):
             "description": "Per-pixel estimate of aboveground biomass uncertainty (1-sigma).",
             "valid_min": 0,
             "valid_max": 1000,
+            # Stored as int16 (half the bytes of int32) without a scale_factor:
+            # lossless only for whole Mg/ha, which _require_whole enforces.
+            # Values beyond +-32767 are clipped (_clip_to_encoding).
+            "encoding": {
+                "dtype": "int16",
+                "_FillValue": -32768,
+            },
         },
     }
 
@@ -138,8 +145,15 @@ class CCIBiomassWriter(BaseZarrWriter):
 
         # --- NaN (from the VRT's -vrtnodata sentinel, i.e. no tile coverage)
         #     -> fill_value -> dtype. 0 is left untouched: it is a genuine
-        #     "zero AGB" data value on non-woody land, not a nodata marker. ---
-        ds = self.apply_fillvalue(ds, fill_value=fill_value).astype("int32")
+        #     "zero AGB" data value on non-woody land, not a nodata marker.
+        #     Variables with their own encoding stay float with NaN: the
+        #     encoding maps NaN to _FillValue and casts to the stored dtype. ---
+        packed = [
+            v for v, meta in self.VARIABLES.items() if "encoding" in meta and v in ds
+        ]
+        ds = self.fill_and_cast(
+            ds.drop_vars(packed), fill_value=fill_value, dtype="int32"
+        ).assign({v: self._clip_to_encoding(self._require_whole(ds[v])) for v in packed})
 
         # --- Variable-level metadata (set every year: zarr append ("mode=a")
         #     overrides existing variable/group attrs with whatever is passed
@@ -169,6 +183,39 @@ class CCIBiomassWriter(BaseZarrWriter):
 
         return ds
 
+    @staticmethod
+    def _require_whole(da: xr.DataArray) -> xr.DataArray:
+        """
+        Pass ``da`` through, raising ValueError (when computed) if a finite
+        value has a fractional part: the integer encoding has no scale_factor
+        and would silently truncate it.
+        """
+
+        def check(a: np.ndarray) -> np.ndarray:
+            if np.any(np.isfinite(a) & (a != np.trunc(a))):
+                raise ValueError(
+                    f"{da.name}: non-integer values cannot be stored losslessly as "
+                    "an unscaled integer; the source is expected in whole Mg/ha"
+                )
+            return a
+
+        return xr.apply_ufunc(
+            check, da, dask="parallelized", output_dtypes=[da.dtype], keep_attrs=True
+        )
+
+    def _clip_to_encoding(self, da: xr.DataArray) -> xr.DataArray:
+        """
+        Clip to the range the variable's encoded integer dtype can hold
+        (excluding _FillValue); xarray's CF encoder casts without checking,
+        so out-of-range values would otherwise wrap around silently.
+        """
+        enc = self.VARIABLES[da.name]["encoding"]
+        info = np.iinfo(enc["dtype"])
+        fill = enc["_FillValue"]
+        lo = info.min + 1 if fill == info.min else info.min
+        hi = info.max - 1 if fill == info.max else info.max
+        return da.clip(lo, hi)
+
     # ------------------------------------------------------------------
     # Write
     # ------------------------------------------------------------------
@@ -240,11 +287,24 @@ class CCIBiomassWriter(BaseZarrWriter):
             self.set_global_metadata(ds, global_meta)
 
             if i == 0:
+                # Chunk tuples follow each variable's own dim order; -1 (or a
+                # dim without an entry) means one chunk along that dim
+                dim_chunks = {"time": 1, **chunks}
                 encoding = {
                     var: {
-                        "chunks": (1, chunks["latitude"], chunks["longitude"]),
+                        "chunks": tuple(
+                            (
+                                ds.sizes[d]
+                                if dim_chunks.get(d, -1) == -1
+                                else dim_chunks[d]
+                            )
+                            for d in ds[var].dims
+                        ),
                         "compressor": DEFAULT_COMPRESSOR,
-                        "fill_value": fill_value,
+                        "write_empty_chunks": False,
+                        **self.VARIABLES.get(var, {}).get(
+                            "encoding", {"_FillValue": fill_value}
+                        ),
                     }
                     for var in ds.data_vars
                 }
@@ -253,7 +313,14 @@ class CCIBiomassWriter(BaseZarrWriter):
                 ds.to_zarr(store=store, mode="w", encoding=encoding, consolidated=False)
             else:
                 print(f"Appending {year} to Ceph/S3...")
-                ds.to_zarr(store=store, mode="a", append_dim="time", consolidated=False)
+                # Ocean-only chunks are all fill_value: skip their PUTs
+                ds.to_zarr(
+                    store=store,
+                    mode="a",
+                    append_dim="time",
+                    consolidated=False,
+                    write_empty_chunks=False,
+                )
 
             del ds
 
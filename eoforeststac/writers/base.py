@@ -1,9 +1,61 @@
+import os
+
 import xarray as xr
 import numpy as np
 import rioxarray  # noqa: F401 — required for .rio accessor on all datasets
 import s3fs
 from typing import Dict, Optional, Set
 
+# GDAL read tuning for raster inputs; opt in with configure_gdal()
+GDAL_READ_DEFAULTS: Dict[str, str] = {
+    "GDAL_CACHEMAX": "2048",  # MB of block cache
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    # Chunk-window reads from several dask threads share HTTP/2 connections
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+    "CPL_VSIL_CURL_CHUNK_SIZE": str(8 * 2**20),  # GDAL caps this at 10 MB
+    # Per-open-file cache of remote bytes (headers, overviews, re-read strips)
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": str(128 * 2**20),
+}
+
+# Botocore client settings for writes: aiobotocore defaults to 10 pooled
+# connections, which caps concurrent chunk PUTs from dask during to_zarr
+S3_WRITE_CONFIG_KWARGS = {
+    "max_pool_connections": 64,
+    "retries": {"mode": "adaptive", "max_attempts": 10},
+}
+S3_BLOCK_SIZE = 16 * 2**20
+
+
+def configure_gdal(**overrides: str) -> None:
+    """
+    Set ``GDAL_READ_DEFAULTS`` (updated with ``overrides``) as environment
+    defaults for this process and processes it starts.
+
+    Environment variables rather than a ``rasterio.Env`` block, because
+    rioxarray reads lazily from dask worker threads long after
+    ``open_rasterio`` returns. Variables already set in the environment are
+    left unchanged. Call once before opening inputs, e.g.
+    ``configure_gdal(GDAL_CACHEMAX="512")``.
+    """
+    for name, value in {**GDAL_READ_DEFAULTS, **overrides}.items():
+        os.environ.setdefault(name, value)
+
+
+def _fill_and_cast_block(
+    a: np.ndarray, fill_value, dtype: np.dtype, zero_is_nodata: bool
+) -> np.ndarray:
+    """Cast one block to ``dtype`` with non-finite (and optionally 0) -> fill."""
+    invalid = ~np.isfinite(a)
+    if zero_is_nodata:
+        invalid |= a == 0
+    with np.errstate(invalid="ignore"):
+        out = a.astype(dtype)
+    out[invalid] = fill_value
+    return out
+
 
 class BaseZarrWriter:
     """
@@ -30,7 +82,9 @@ class BaseZarrWriter:
             "client_kwargs": {
                 "endpoint_url": endpoint_url,
                 "region_name": region,
-            }
+            },
+            "config_kwargs": S3_WRITE_CONFIG_KWARGS,
+            "default_block_size": S3_BLOCK_SIZE,
         }
 
         if anon:
@@ -65,7 +119,64 @@ class BaseZarrWriter:
 
     @staticmethod
     def apply_fillvalue(ds: xr.Dataset, fill_value=-9999) -> xr.Dataset:
-        return ds.where(np.isfinite(ds), fill_value)
+        """
+        Replace non-finite values with ``fill_value`` (dtypes unchanged).
+
+        One blockwise pass per floating variable, without the full-size
+        ``isfinite`` mask array of ``ds.where``; integer variables cannot
+        hold NaN/inf and are passed through untouched (for a finite fill).
+        """
+        out = ds.copy()
+        for var in ds.data_vars:
+            da = ds[var]
+            if da.dtype.kind not in "fc":
+                if not np.isfinite(fill_value):
+                    # NaN fill on integers promotes the dtype; keep where()
+                    out[var] = da.where(np.isfinite(da), fill_value)
+                continue
+            out[var] = xr.apply_ufunc(
+                _fill_and_cast_block,
+                da,
+                kwargs={
+                    "fill_value": fill_value,
+                    "dtype": da.dtype,
+                    "zero_is_nodata": False,
+                },
+                dask="parallelized",
+                output_dtypes=[da.dtype],
+                keep_attrs=True,
+            )
+        return out
+
+    @staticmethod
+    def fill_and_cast(
+        ds: xr.Dataset,
+        fill_value=-9999,
+        dtype: str = "int32",
+        zero_is_nodata: bool = False,
+    ) -> xr.Dataset:
+        """
+        Fused ``apply_fillvalue(...).astype(dtype)``, optionally also mapping 0 to
+        ``fill_value`` (same result as a preceding ``.where(ds[var] != 0)``).
+
+        Each block is read once and written once as ``dtype``: no float
+        promotion for the NaN step and no intermediate float array.
+        """
+        out = ds.copy()
+        for var in ds.data_vars:
+            out[var] = xr.apply_ufunc(
+                _fill_and_cast_block,
+                ds[var],
+                kwargs={
+                    "fill_value": fill_value,
+                    "dtype": np.dtype(dtype),
+                    "zero_is_nodata": zero_is_nodata,
+                },
+                dask="parallelized",
+                output_dtypes=[np.dtype(dtype)],
+                keep_attrs=True,
+            )
+        return out
 
     @staticmethod
     def set_crs(ds: xr.Dataset, crs: str = "EPSG:4326") -> xr.Dataset:
@@ -94,10 +205,13 @@ class BaseZarrWriter:
         Accepts both Dataset and DataArray.
         """
         if isinstance(obj, xr.DataArray):
-            for key in self._CF_STRIP_KEYS:
-                obj.attrs.pop(key, None)
-            return obj
-        for var in obj.data_vars:
-            for key in self._CF_STRIP_KEYS:
-                obj[var].attrs.pop(key, None)
+            attrs_list = [obj.attrs]
+        else:
+            # Mutate the Variable attrs in place: obj[var] would build a
+            # DataArray wrapper per variable just to reach the same dict
+            variables = obj.variables
+            attrs_list = [variables[var].attrs for var in obj.data_vars]
+        for attrs in attrs_list:
+            for key in self._CF_STRIP_KEYS.intersection(attrs):
+                del attrs[key]
         return obj
@@ -2,19 +2,30 @@
 
 from __future__ import annotations
 
-import gc
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Sequence
 
+import dask
+import dask.array as dsa
 import numpy as np
 import rioxarray
 import xarray as xr
 import zarr
+from numcodecs import Delta
 
-from eoforeststac.core.zarr import DEFAULT_COMPRESSOR
+from eoforeststac.core.zarr import CATEGORICAL_COMPRESSOR, COORDINATE_COMPRESSOR
 from eoforeststac.writers.base import BaseZarrWriter
 
+# Years whose (lazy) datasets are built ahead of the year being written
+_PREFETCH_YEARS = 4
+# Years whose region writes are computed together (overlapping their S3 PUTs)
+_WRITE_BATCH_YEARS = 8
+
 
 class EFDAWriter(BaseZarrWriter):
     """
@@ -32,7 +43,12 @@ class EFDAWriter(BaseZarrWriter):
           disturbance_agent(time, y, x)
 
     Strategy:
-      - stream year-by-year and append along time (no concat, no huge lists)
+      - pre-allocate the full time axis once, then stream year-by-year into
+        each year's time slice (region writes: no concat, no append rewrites)
+      - build the next years' lazy datasets (GeoTIFF header reads) in the
+        background while the current year is written
+      - optionally fan years out to worker processes (``processes=``), each
+        writing its own time slice
       - consolidate metadata at end to produce .zmetadata
     """
 
@@ -55,19 +71,37 @@ class EFDAWriter(BaseZarrWriter):
             raise FileNotFoundError(f"EFDA GeoTIFF not found: {tif_path}")
 
         # mask_and_scale=False avoids carrying add_offset/scale_factor semantics into attrs
-        da = (
-            rioxarray.open_rasterio(
-                tif_path,
-                chunks={"y": chunks["y"], "x": chunks["x"]},
-                mask_and_scale=False,
-            )
-            .squeeze(drop=True)
-            .rename(var_name)
+        raw = rioxarray.open_rasterio(
+            tif_path,
+            chunks={"y": chunks["y"], "x": chunks["x"]},
+            mask_and_scale=False,
         )
+        # Cast while still 2-D, so the dtype change fuses with the read
+        da = raw.squeeze(drop=True).rename(var_name).astype("int16")
 
         # Attach time coordinate and keep it as length-1 dimension
         da = da.assign_coords(time=np.datetime64(f"{year}-01-01")).expand_dims("time")
-        return da.astype("int16")
+        # Derived arrays drop the file handle; keep close() reaching the GeoTIFF
+        da.set_close(raw.close)
+        return da
+
+    def _open_forest_mask(
+        self, forest_mask_path: str, chunks: Dict[str, int]
+    ) -> xr.DataArray:
+        """
+        Open the (year-independent) forest mask lazily as a (y, x) DataArray.
+
+        Kept as read (float, nodata → NaN): it is only compared with 1, and
+        NaN == 1 is simply False, so no cast is needed.
+        """
+        raw = rioxarray.open_rasterio(
+            Path(forest_mask_path),
+            chunks={"y": chunks["y"], "x": chunks["x"]},
+            masked=True,  # ← nodata → NaN, enabling domain detection
+        )
+        da = raw.squeeze(drop=True)
+        da.set_close(raw.close)
+        return da
 
     # ------------------------------------------------------------------
     # Build per-year dataset
@@ -84,6 +118,7 @@ class EFDAWriter(BaseZarrWriter):
         dtype: str = "int16",
         forest_mask_path: Optional[str] = None,
         _FillValue: int = -9999,
+        forest_mask: Optional[xr.DataArray] = None,
     ) -> xr.Dataset:
         """
         Build a 1-year Dataset(time=1, y, x) containing both vars.
@@ -92,29 +127,46 @@ class EFDAWriter(BaseZarrWriter):
           - 1  where disturbed forest (forest_mask == 1 and disturbance == 1)
           - 0  where undisturbed forest (forest_mask == 1 and disturbance == 0)
           - _FillValue (NaN sentinel) where not forest (forest_mask != 1)
-        """
-        da_mosaic = self._open_year_da(
-            mosaic_dir, year, mosaic_pattern, "disturbance_occurrence", chunks=chunks
-        )
-        da_agent = self._open_year_da(
-            agent_dir, year, agent_pattern, "disturbance_agent", chunks=chunks
-        )
 
-        forest_mask_raw = (
-            rioxarray.open_rasterio(
-                Path(forest_mask_path),
-                chunks={"y": chunks["y"], "x": chunks["x"]},
-                masked=True,  # ← nodata → NaN, enabling domain detection
+        An already opened ``forest_mask`` (see ``_open_forest_mask``) is used
+        as-is instead of reopening ``forest_mask_path``.
+        """
+        # Opening reads GeoTIFF headers (I/O-bound); overlap the opens
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            fut_mosaic = pool.submit(
+                self._open_year_da,
+                mosaic_dir,
+                year,
+                mosaic_pattern,
+                "disturbance_occurrence",
+                chunks=chunks,
             )
-            .squeeze(drop=True)
-            .astype("int16")
-        )
+            fut_agent = pool.submit(
+                self._open_year_da,
+                agent_dir,
+                year,
+                agent_pattern,
+                "disturbance_agent",
+                chunks=chunks,
+            )
+            fut_mask = (
+                None
+                if forest_mask is not None
+                else pool.submit(self._open_forest_mask, forest_mask_path, chunks)
+            )
+            da_mosaic = fut_mosaic.result()
+            da_agent = fut_agent.result()
+            forest_mask_raw = forest_mask if fut_mask is None else fut_mask.result()
+
+        # GeoTIFFs opened for this year only; closed by ds.close() after writing
+        sources = [da_mosaic, da_agent]
+        if fut_mask is not None:
+            sources.append(forest_mask_raw)
 
         # 1 = disturbed forest, 0 = undisturbed forest, _FillValue = non-forest OR outside domain
-        da_mosaic = da_mosaic.where(forest_mask_raw == 1, other=_FillValue).astype(
-            dtype
-        )
-        da_agent = da_agent.where(forest_mask_raw == 1, other=_FillValue).astype(dtype)
+        is_forest = forest_mask_raw == 1
+        da_mosaic = da_mosaic.where(is_forest, other=_FillValue).astype(dtype)
+        da_agent = da_agent.where(is_forest, other=_FillValue).astype(dtype)
 
         ds = xr.Dataset(
             {
@@ -155,6 +207,7 @@ class EFDAWriter(BaseZarrWriter):
                 }
             )
 
+        ds.set_close(lambda: [da.close() for da in sources])
         return ds
 
     # ------------------------------------------------------------------
@@ -228,27 +281,134 @@ class EFDAWriter(BaseZarrWriter):
     # Zarr encoding
     # ------------------------------------------------------------------
     def make_encoding(
-        self, chunks: Dict[str, int], _FillValue: int = -9999
+        self,
+        chunks: Dict[str, int],
+        _FillValue: int = -9999,
+        n_years: Optional[int] = None,
     ) -> Dict[str, Dict]:
+        """
+        Per-variable Zarr encoding. With ``n_years`` the time coordinate is
+        also encoded: one chunk for the whole axis, delta-filtered int64.
+        """
         zchunks = (1, chunks["y"], chunks["x"])
 
-        return {
+        encoding = {
             "disturbance_occurrence": {
                 "dtype": "int16",
                 "chunks": zchunks,
-                "compressor": DEFAULT_COMPRESSOR,
+                "compressor": CATEGORICAL_COMPRESSOR,
                 "_FillValue": np.int16(_FillValue),
+                "write_empty_chunks": False,
             },
             "disturbance_agent": {
                 "dtype": "int16",
                 "chunks": zchunks,
-                "compressor": DEFAULT_COMPRESSOR,
+                "compressor": CATEGORICAL_COMPRESSOR,
                 "_FillValue": np.int16(_FillValue),
+                "write_empty_chunks": False,
             },
         }
+        if n_years is not None:
+            encoding["time"] = {
+                "dtype": "int64",
+                "chunks": (n_years,),
+                "compressor": COORDINATE_COMPRESSOR,
+                "filters": [Delta(dtype="<i8")],
+            }
+        return encoding
 
     # ------------------------------------------------------------------
-    # Main write (STREAM + APPEND + FINAL CONSOLIDATION)
+    # Store layout
+    # ------------------------------------------------------------------
+    def _initialize_store(
+        self,
+        ds_first: xr.Dataset,
+        years: Sequence[int],
+        store,
+        encoding: Dict[str, Dict],
+    ) -> None:
+        """
+        Write metadata and coordinates for all years at once.
+
+        Data variables are lazy zeros shaped (len(years), y, x) and written with
+        compute=False, so no chunk is stored; each year then fills its own time
+        slice with a region write.
+        """
+        data_vars = {}
+        for name, da in ds_first.data_vars.items():
+            shape = (len(years),) + da.shape[1:]
+            chunks = (1,) + da.data.chunksize[1:]
+            data_vars[name] = (
+                da.dims,
+                dsa.zeros(shape, chunks=chunks, dtype=da.dtype),
+                da.attrs,
+            )
+
+        coords = {k: v for k, v in ds_first.coords.items() if k != "time"}
+        coords["time"] = [np.datetime64(f"{year}-01-01") for year in years]
+
+        template = xr.Dataset(data_vars, coords=coords, attrs=ds_first.attrs)
+        template.to_zarr(
+            store=store,
+            mode="w",
+            encoding=encoding,
+            compute=False,
+            consolidated=False,
+        )
+
+    def _prepare_year(
+        self, ds_year: xr.Dataset, _FillValue: int, crs: str, version: str
+    ) -> xr.Dataset:
+        """Add metadata and strip CF serialization attrs (_FillValue,
+        scale_factor, add_offset, missing_value) from variable attrs."""
+        ds_year = self.add_metadata(
+            ds_year, _FillValue=_FillValue, crs=crs, version=version
+        )
+        return self._strip_cf_serialization_attrs(ds_year)
+
+    @staticmethod
+    def _write_region(ds_year: xr.Dataset, store, index: int, compute: bool = True):
+        """
+        Write one year into time slice ``index`` of a store laid out by
+        ``_initialize_store``. Returns the delayed write when ``compute=False``.
+        """
+        # _initialize_store already wrote x/y/spatial_ref and every time value;
+        # rewriting "time" would make concurrent years read-modify-write its
+        # single chunk, so only the data variables go through the region write
+        static = [n for n in ds_year.variables if "time" not in ds_year[n].dims]
+        return ds_year.drop_vars([*static, "time"]).to_zarr(
+            store=store,
+            region={"time": slice(index, index + 1)},
+            consolidated=False,
+            compute=compute,
+            # Non-forest-only chunks equal _FillValue: skip their PUTs
+            write_empty_chunks=False,
+        )
+
+    def _write_year_process(
+        self,
+        output_zarr: str,
+        index: int,
+        year: int,
+        build_kwargs: Dict,
+        prepare_kwargs: Dict,
+        num_threads: int,
+    ) -> int:
+        """Process-pool task: build, write and close one year's time slice."""
+        store = self.make_store(output_zarr)
+        ds_year = self._prepare_year(
+            self.build_year_dataset(year=year, **build_kwargs), **prepare_kwargs
+        )
+        try:
+            # Share the cores with the other worker processes
+            with dask.config.set(scheduler="threads", num_workers=num_threads):
+                self._write_region(ds_year, store, index)
+        finally:
+            ds_year.close()
+        return year
+
+    # ------------------------------------------------------------------
+    # Main write (PRE-ALLOCATE + REGION WRITES + FINAL CONSOLIDATION)
     # ------------------------------------------------------------------
     def write(
         self,
@@ -265,10 +425,15 @@ class EFDAWriter(BaseZarrWriter):
         chunks: Dict[str, int] = None,
         dtype: str = "int16",
         consolidate_at_end: bool = True,
+        batch_years: int = _WRITE_BATCH_YEARS,
+        processes: Optional[int] = None,
     ) -> str:
         """
         Stream yearly EFDA GeoTIFFs into a single Zarr store along time.
 
+        The store is laid out for all ``years`` up front; year ``i`` is then
+        written into time slice ``i``.
+
         Parameters
         ----------
         forest_mask_path : str, optional
@@ -277,6 +442,19 @@ class EFDAWriter(BaseZarrWriter):
               1  = disturbed forest
               0  = undisturbed forest
               _FillValue = non-forest (treated as NaN by xarray on read)
+        batch_years : int
+            Number of years whose region writes are computed in a single
+            dask.compute (their time slices are disjoint, so the writes can
+            overlap). 1 writes year by year.
+        processes : int, optional
+            Build and write years in this many worker processes (each
+            opening its own GeoTIFFs and store) instead of streaming them
+            from this process. Useful when GeoTIFF decoding and compression
+            outrun one interpreter; ``batch_years`` is then unused.
+            Workers are started with the "spawn" method, which re-imports
+            the calling script: scripts must call ``write()`` under an
+            ``if __name__ == "__main__":`` guard, and the writer (including
+            any subclass) must be picklable.
         """
         years = [int(y) for y in years]
 
@@ -284,47 +462,41 @@ class EFDAWriter(BaseZarrWriter):
             chunks = {"y": 1000, "x": 1000}
 
         # fixed encoding for initialization
-        encoding = self.make_encoding(chunks=chunks, _FillValue=_FillValue)
+        encoding = self.make_encoding(
+            chunks=chunks, _FillValue=_FillValue, n_years=len(years)
+        )
 
         # store
         store = self.make_store(output_zarr)
 
-        for i, year in enumerate(years):
-            print(f"EFDA: processing {year} ({i + 1}/{len(years)})")
-
-            ds_year = self.build_year_dataset(
-                mosaic_dir=mosaic_dir,
-                agent_dir=agent_dir,
-                year=year,
-                mosaic_pattern=mosaic_pattern,
-                agent_pattern=agent_pattern,
-                crs=crs,
-                chunks=chunks,
-                dtype=dtype,
-                forest_mask_path=forest_mask_path,
-                _FillValue=_FillValue,
-            )
-
-            # Add human-readable metadata
-            ds_year = self.add_metadata(
-                ds_year, _FillValue=_FillValue, crs=crs, version=version
+        build_kwargs = dict(
+            mosaic_dir=mosaic_dir,
+            agent_dir=agent_dir,
+            mosaic_pattern=mosaic_pattern,
+            agent_pattern=agent_pattern,
+            crs=crs,
+            chunks=chunks,
+            dtype=dtype,
+            forest_mask_path=forest_mask_path,
+            _FillValue=_FillValue,
+        )
+        prepare_kwargs = dict(_FillValue=_FillValue, crs=crs, version=version)
+
+        if processes:
+            self._write_processes(
+                output_zarr,
+                store,
+                years,
+                encoding,
+                build_kwargs,
+                prepare_kwargs,
+                processes,
             )
-
-            # Strip CF serialization attrs (_FillValue, scale_factor, add_offset,
-            # missing_value) from variable attrs on every year.
-            ds_year = self._strip_cf_serialization_attrs(ds_year)
-
-            ds_year.to_zarr(
-                store=store,
-                mode="w" if i == 0 else "a",
-                append_dim=None if i == 0 else "time",
-                encoding=encoding if i == 0 else None,
-                consolidated=False,
+        else:
+            self._write_stream(
+                store, years, encoding, build_kwargs, prepare_kwargs, batch_years
             )
 
-            del ds_year
-            gc.collect()
-
         if consolidate_at_end:
             zarr.consolidate_metadata(store)
         else:
@@ -334,3 +506,106 @@ class EFDAWriter(BaseZarrWriter):
 
         print(f"EFDA: done → {output_zarr}")
         return output_zarr
+
+    def _write_processes(
+        self,
+        output_zarr: str,
+        store,
+        years: Sequence[int],
+        encoding: Dict[str, Dict],
+        build_kwargs: Dict,
+        prepare_kwargs: Dict,
+        processes: int,
+    ) -> None:
+        """
+        Lay out the store here, then fan the years out to worker processes.
+
+        Each year owns a disjoint time slice (time chunk 1), so the region
+        writes need no coordination between processes.
+        """
+        ds_first = self._prepare_year(
+            self.build_year_dataset(year=years[0], **build_kwargs), **prepare_kwargs
+        )
+        self._initialize_store(ds_first, years, store, encoding)
+        ds_first.close()
+
+        num_threads = max(1, (os.cpu_count() or 1) // processes)
+        # spawn: forking would copy the parent's dask/s3fs threads and locks
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self._write_year_process,
+                    output_zarr,
+                    i,
+                    year,
+                    build_kwargs,
+                    prepare_kwargs,
+                    num_threads,
+                )
+                for i, year in enumerate(years)
+            ]
+            for n, fut in enumerate(as_completed(futures), 1):
+                print(f"EFDA: wrote {fut.result()} ({n}/{len(years)})")
+
+    def _write_stream(
+        self,
+        store,
+        years: Sequence[int],
+        encoding: Dict[str, Dict],
+        build_kwargs: Dict,
+        prepare_kwargs: Dict,
+        batch_years: int,
+    ) -> None:
+        """Stream years from this process, computing region writes in batches."""
+        # Same mask for every year: open it once, not once per year
+        forest_mask_path = build_kwargs["forest_mask_path"]
+        forest_mask = (
+            self._open_forest_mask(forest_mask_path, build_kwargs["chunks"])
+            if forest_mask_path is not None
+            else None
+        )
+
+        def _build(year: int) -> xr.Dataset:
+            return self.build_year_dataset(
+                year=year, forest_mask=forest_mask, **build_kwargs
+            )
+
+        # Building a year only opens GeoTIFFs (header reads) and assembles a
+        # dask graph, so the next years are prepared while this one is written.
+        # Year 0 also lays out the store; every year then writes its own slice.
+        with ThreadPoolExecutor(max_workers=_PREFETCH_YEARS) as pool:
+            pending = deque(pool.submit(_build, y) for y in years[:_PREFETCH_YEARS])
+            next_year = len(pending)
+            # (year dataset, delayed region write) not yet computed
+            batch = []
+
+            for i, year in enumerate(years):
+                print(f"EFDA: processing {year} ({i + 1}/{len(years)})")
+
+                ds_year = pending.popleft().result()
+                if next_year < len(years):
+                    pending.append(pool.submit(_build, years[next_year]))
+                    next_year += 1
+
+                # Human-readable metadata; CF attrs stripped on every year
+                ds_year = self._prepare_year(ds_year, **prepare_kwargs)
+
+                if i == 0:
+                    self._initialize_store(ds_year, years, store, encoding)
+
+                delayed = self._write_region(ds_year, store, i, compute=False)
+                batch.append((ds_year, delayed))
+                del ds_year
+
+                if len(batch) >= max(1, batch_years) or i == len(years) - 1:
+                    print(f"EFDA: writing {len(batch)} year(s)")
+                    dask.compute(*(d for _, d in batch))
+                    # Release the years' GeoTIFF handles; the graphs hold no data
+                    for ds_done, _ in batch:
+                        ds_done.close()
+                    batch.clear()
+
+        if forest_mask is not None:
+            forest_mask.close()
@@ -128,10 +128,8 @@ class HansenGFCWriter(BaseZarrWriter):
             rename_dims["y"] = "latitude"
 
         if rename_dims:
+            # Renames each dim together with its index coordinate
             ds = ds.rename(rename_dims)
-            for old, new in rename_dims.items():
-                if old in ds.coords:
-                    ds = ds.rename({old: new})
 
         # --------------------------------------------------
         # Chunking
@@ -19,15 +19,30 @@ class SaatchiBiomassWriter(BaseZarrWriter):
     # ------------------------------------------------------------------
     # Load
     # ------------------------------------------------------------------
-    def load_dataset(self, tif_path: str) -> xr.Dataset:
+    def load_dataset(
+        self, tif_path: str, chunks: Optional[Dict[str, int]] = None
+    ) -> xr.Dataset:
         """
         Load GeoTIFF lazily and return a Dataset with variable name `agb`.
+
+        The variable is dask-backed; nothing is read until it is computed
+        (call ``.load()`` for eager behaviour).
         """
+        # Map caller's lat/lon chunk keys to rioxarray's native x/y keys so
+        # chunks are applied at read time and no rechunking is needed later.
+        rio_chunks: Optional[Dict[str, int]] = None
+        if chunks is not None:
+            rio_chunks = {
+                "x": chunks.get("longitude", chunks.get("x", "auto")),
+                "y": chunks.get("latitude", chunks.get("y", "auto")),
+            }
 
         da = (
             rioxarray.open_rasterio(
                 tif_path,
                 masked=True,
+                chunks=rio_chunks if rio_chunks is not None else "auto",
+                lock=False,
             )
             .squeeze(drop=True)
             .rename("agb")
@@ -64,13 +79,9 @@ class SaatchiBiomassWriter(BaseZarrWriter):
             rename_dims["y"] = "latitude"
 
         if rename_dims:
+            # Renames each dim together with its index coordinate
             ds = ds.rename(rename_dims)
 
-            # also rename coordinates explicitly if present
-            for old, new in rename_dims.items():
-                if old in ds.coords:
-                    ds = ds.rename({old: new})
-
         # --------------------------------------------------
         # Add reference time coordinate (single epoch)
         # --------------------------------------------------
@@ -81,12 +92,10 @@ class SaatchiBiomassWriter(BaseZarrWriter):
         if chunks is not None:
             ds = ds.chunk(chunks)
 
-        # --- Zero → NaN → fill_value → dtype (SAFE) ---
-        for var in ds.data_vars:
-            ds[var] = ds[var].where(ds[var] != 0)
-
-        # --- Fill values + dtype ---
-        ds = self.apply_fillvalue(ds, fill_value=fill_value).astype("int32")
+        # --- Zero / NaN → fill_value → dtype, in one pass per block ---
+        ds = self.fill_and_cast(
+            ds, fill_value=fill_value, dtype="int32", zero_is_nodata=True
+        )
 
         # --- Variable metadata ---
         if "agb" in ds:
@@ -154,7 +163,7 @@ class SaatchiBiomassWriter(BaseZarrWriter):
             }
 
         print("Loading dataset…")
-        ds = self.load_dataset(tif_path)
+        ds = self.load_dataset(tif_path, chunks=chunks)
 
         print("Processing dataset…")
         ds = self.process_dataset(